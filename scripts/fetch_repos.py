@@ -9,10 +9,6 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from dotenv import load_dotenv
-
-from github_fetcher import GitHubFetcher
-
 
 def main():
     """Main CLI entry point."""
@@ -46,6 +42,9 @@ Examples:
   # Fetch a single repository
   python fetch_repos.py --repo "microsoft/vscode" -o vscode.parquet
 
+  # Fetch several repositories (batched into as few API calls as possible)
+  python fetch_repos.py --repo "microsoft/vscode,python/cpython" -o repos.parquet
+
 Available filters for --filter:
   language:Python       - Filter by language
   pushed:>=2022-01-01   - Recent activity
@@ -72,7 +71,7 @@ Available filters for --filter:
     search_group.add_argument(
         "--repo",
         type=str,
-        help="Fetch a single repository by 'owner/name'"
+        help="Fetch repositories by 'owner/name' (comma-separated for several)"
     )
 
     # Filter options
@@ -126,23 +125,41 @@ Available filters for --filter:
         default=None,
         help="Load users from a previously saved CSV file (skips Step 1)"
     )
+    output_group.add_argument(
+        "--fields",
+        type=str,
+        default=None,
+        help="Comma-separated output columns to fetch (default: all), e.g. 'stars,primary_language,pushed_at'"
+    )
+    output_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk response cache (.gh_cache, entries kept 24h)"
+    )
 
     # Authentication
     auth_group = parser.add_argument_group("Authentication")
     auth_group.add_argument(
         "--token",
         type=str,
-        help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)"
+        help="GitHub Personal Access Token (or set GITHUB_TOKEN env var); "
+             "comma-separate several to spread requests over their rate limits"
     )
 
     args = parser.parse_args()
 
+    # Imported after argument parsing so --help and usage errors start fast
+    from dotenv import load_dotenv
+
+    from github_fetcher import GitHubFetcher
+
     # Load environment variables
     load_dotenv()
 
     # Get token
     token = args.token or os.environ.get("GITHUB_TOKEN")
-    if not token:
+    tokens = [t.strip() for t in token.split(",") if t.strip()] if token else []
+    if not tokens:
         print("Error: GitHub token required. Set GITHUB_TOKEN env var or use --token")
         print("Get a token at: https://github.com/settings/tokens")
         sys.exit(1)
@@ -158,9 +175,11 @@ Available filters for --filter:
     if not output_path.suffix:
         output_path = output_path.with_suffix(".parquet")
 
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+
     # Initialize fetcher
     try:
-        fetcher = GitHubFetcher(token)
+        fetcher = GitHubFetcher(tokens, use_cache=not args.no_cache, fields=fields)
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -168,11 +187,12 @@ Available filters for --filter:
     # Fetch data
     try:
         if args.repo:
-            # Single repository mode
-            print(f"Fetching repository: {args.repo}")
-            repo_data = fetcher.fetch_repo_details(args.repo)
-            if repo_data:
-                fetcher._repos = [repo_data]
+            # Repository mode (one or more owner/name)
+            nwos = [nwo.strip() for nwo in args.repo.split(",") if nwo.strip()]
+            print(f"Fetching repositories: {', '.join(nwos)}")
+            repos = fetcher.fetch_repo_details_batch(nwos)
+            if repos:
+                fetcher._repos = repos
             else:
                 print(f"Repository not found: {args.repo}")
                 sys.exit(1)
@@ -1,7 +1,7 @@
 """GitHub Repository Fetcher using GraphQL API."""
 
-from .client import GitHubGraphQLClient
+from .client import GitHubGraphQLClient, RateLimitBroker
 from .fetcher import GitHubFetcher
 
 __version__ = "1.0.0"
-__all__ = ["GitHubGraphQLClient", "GitHubFetcher"]
+__all__ = ["GitHubGraphQLClient", "GitHubFetcher", "RateLimitBroker"]
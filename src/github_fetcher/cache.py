@@ -0,0 +1,109 @@
+"""Persistent on-disk cache for GraphQL responses."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import orjson
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of GraphQL response data keyed on query + variables.
+
+    Recently used entries are also kept in memory, so repeated lookups within
+    a run skip the database and JSON decoding.
+    """
+
+    # Default time-to-live for cached responses (seconds)
+    DEFAULT_EXPIRE = 86400
+
+    # Maximum entries kept in memory in front of the database
+    MEMORY_SIZE = 2048
+
+    def __init__(self, directory: Union[str, Path] = ".gh_cache", expire: int = DEFAULT_EXPIRE):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache database
+            expire: Seconds before a cached response is considered stale
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.expire = expire
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._conn = sqlite3.connect(
+            str(self.directory / "responses.db"),
+            check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(query: str, variables: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for a query.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            Hex digest identifying the query and its variables
+        """
+        raw = query.encode("utf-8") + orjson.dumps(variables or {}, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(raw).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get cached response data, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] >= now:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT data, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if not row or row[1] < now:
+                return None
+            data = orjson.loads(row[0])
+            self._remember(key, row[1], data)
+        return data
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        """Store response data under key."""
+        expires_at = time.time() + self.expire
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, data, expires_at) VALUES (?, ?, ?)",
+                (key, orjson.dumps(data), expires_at)
+            )
+            self._conn.commit()
+            self._remember(key, expires_at, data)
+
+    def _remember(self, key: str, expires_at: float, data: Dict[str, Any]) -> None:
+        """Keep an entry in memory, evicting the least recently used (lock held)."""
+        self._memory[key] = (expires_at, data)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.MEMORY_SIZE:
+            self._memory.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.close()
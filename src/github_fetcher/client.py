@@ -1,12 +1,148 @@
 """GitHub GraphQL API client with authentication and rate limiting."""
 
+import gzip
+import threading
 import time
-from typing import Any, Dict, Optional
+import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Deque, Dict, Generator, List, Optional, Sequence, Tuple, Union
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
+from urllib3.util.retry import Retry
 
-from .queries import RATE_LIMIT_QUERY
-from .utils import calculate_wait_time, exponential_backoff, format_rate_limit_info
+from .cache import ResponseCache
+from .queries import RATE_LIMIT_QUERY, SEARCH_REPOS_QUERY, build_repo_batch_query
+from .utils import (
+    QueryTooLargeError,
+    RateLimitError,
+    calculate_wait_time,
+    exponential_backoff,
+    format_rate_limit_info,
+)
+
+
+@lru_cache(maxsize=128)
+def _encode_query(query: str) -> bytes:
+    """JSON-encode a query string (queries are module constants, reused per request)."""
+    return orjson.dumps(query)
+
+
+class _BearerAuth(AuthBase):
+    """Attach a precomputed bearer token header to each request."""
+
+    def __init__(self, token: str):
+        self._header = f"Bearer {token}"
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        request.headers["Authorization"] = self._header
+        return request
+
+
+class RateLimitBroker:
+    """
+    Pacing for the GitHub GraphQL rate limit, shared across threads.
+
+    Requests go out freely while the recent spending rate, kept up until the
+    reset, fits in the budget above ``reserve``. Once it would not (or the
+    budget is used up), requests are spaced so the remaining budget is spread
+    evenly over the time left until the reset. Each request is charged its
+    expected point cost when it is sent, so concurrent workers see the budget
+    shrink before their responses arrive; every response then replaces the
+    estimate with GitHub's own figures. One broker can be shared by several
+    clients that use the same token.
+    """
+
+    # Seconds of recent requests the spending rate is measured over
+    RATE_WINDOW = 60.0
+
+    def __init__(self, reserve: int = 0):
+        """
+        Args:
+            reserve: Rate limit points to keep untouched
+        """
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self._remaining: Optional[float] = None
+        self._reset_deadline = 0.0    # monotonic time of the reset
+        self._cost = 1.0              # points charged by the last request
+        self._next_request_at = 0.0   # monotonic time of the next free slot
+
+        # (monotonic time, cost) of the requests within RATE_WINDOW
+        self._recent: Deque[Tuple[float, float]] = deque()
+        self._recent_points = 0.0
+
+    def acquire(self, cost: Optional[float] = None) -> float:
+        """
+        Charge one request against the budget and sleep until its slot.
+
+        Args:
+            cost: Expected point cost of the request (default: what the last
+                request cost)
+
+        Returns:
+            Seconds slept
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_at)
+            if self._remaining is not None:
+                cost = self._cost if cost is None else max(cost, 1.0)
+                self._recent.append((now, cost))
+                self._recent_points += cost
+                while self._recent[0][0] < now - self.RATE_WINDOW:
+                    self._recent_points -= self._recent.popleft()[1]
+
+                seconds_to_reset = max(0.0, self._reset_deadline - now)
+                budget = self._remaining - self.reserve
+                projected = self._recent_points / self.RATE_WINDOW * seconds_to_reset
+                if budget < cost:
+                    # Nothing left above the reserve: wait for the reset
+                    start = max(start, now + seconds_to_reset)
+                    self._next_request_at = start
+                elif projected > budget:
+                    self._next_request_at = start + seconds_to_reset / (budget / cost)
+                self._remaining -= cost
+
+        wait_time = start - now
+        if wait_time > 0:
+            if wait_time >= 60:
+                print(f"\n  Rate limit low. Waiting {wait_time:.0f}s before next request...")
+            time.sleep(wait_time)
+        return wait_time
+
+    @property
+    def next_slot(self) -> float:
+        """Monotonic time at which the next request may be sent."""
+        return self._next_request_at
+
+    def pause(self, seconds: float) -> None:
+        """Hold back requests for the given time (e.g. after a rate limit error)."""
+        with self._lock:
+            self._next_request_at = max(self._next_request_at, time.monotonic() + seconds)
+
+    def update(self, remaining: float, reset_at: float, cost: Optional[float] = None) -> None:
+        """
+        Record the rate limit reported by a response.
+
+        Args:
+            remaining: Points remaining in the current window
+            reset_at: Epoch seconds when the window resets
+            cost: Points the request cost, if reported
+        """
+        # The wall clock is read once here; pacing then runs on the
+        # monotonic clock, unaffected by system clock adjustments
+        reset_deadline = time.monotonic() + max(0.0, reset_at - time.time())
+        with self._lock:
+            self._remaining = float(remaining)
+            self._reset_deadline = reset_deadline
+            if cost:
+                self._cost = max(float(cost), 1.0)
 
 
 class GitHubGraphQLClient:
@@ -14,36 +150,144 @@ class GitHubGraphQLClient:
 
     API_URL = "https://api.github.com/graphql"
 
-    def __init__(self, token: str):
+    # Maximum number of GraphQL requests kept in flight by execute_many
+    MAX_WORKERS = 8
+
+    # Requests on the wire at once across all threads. Thread pools nest
+    # (user group searches hydrate READMEs with execute_many), and GitHub's
+    # secondary rate limits punish bursts of concurrent requests.
+    MAX_CONCURRENT_REQUESTS = 10
+
+    # Kept-alive connections to the API (enough for larger execute_many pools)
+    POOL_SIZE = 32
+
+    # (connect, read) timeouts in seconds; GitHub itself gives up on a query
+    # after about 10s, so a longer silence means a stalled connection
+    TIMEOUT = (10, 60)
+
+    # Maximum aliased repository lookups packed into one request
+    REPO_BATCH_SIZE = 50
+
+    # Request bodies larger than this (bytes) are sent gzip-compressed
+    COMPRESS_THRESHOLD = 2048
+
+    # Search page size bounds and the rateLimit cost each page is sized for
+    MIN_PAGE_SIZE = 10
+    MAX_PAGE_SIZE = 100
+    DEFAULT_PAGE_SIZE = 50
+    TARGET_PAGE_COST = 5
+
+    # Weight of the newest page in the running cost-per-result estimate
+    COST_SMOOTHING = 0.3
+
+    # GraphQL error types meaning the query asked for too much at once
+    QUERY_LIMIT_ERRORS = frozenset({"MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED"})
+
+    def __init__(
+        self,
+        token: Union[str, Sequence[str]],
+        use_cache: bool = False,
+        cache_dir: Union[str, Path] = ".gh_cache",
+        broker: Optional[RateLimitBroker] = None
+    ):
         """
         Initialize the GitHub GraphQL client.
 
         Args:
-            token: GitHub Personal Access Token
+            token: GitHub Personal Access Token, or several tokens to spread
+                requests over (each with its own rate limit)
+            use_cache: Cache successful responses on disk and reuse them
+            cache_dir: Directory for the response cache
+            broker: Rate limit broker to share with other clients using the
+                (first) token (default: a private one)
         """
-        if not token:
+        tokens = [token] if isinstance(token, str) else list(token)
+        if not tokens or not all(tokens):
             raise ValueError("GitHub token is required")
 
-        self.token = token
+        self.token = tokens[0]
+        self.tokens = tokens
         self.session = requests.Session()
+        # requests already advertises gzip/deflate (and br when brotli is
+        # installed) and decodes compressed responses transparently
         self.session.headers.update({
-            "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         })
+        # Session-level auth also stops requests from reading ~/.netrc per call
+        self.session.auth = _BearerAuth(tokens[0])
+        self._auths = [_BearerAuth(t) for t in tokens]
+
+        # Keep a warm connection per concurrent worker and retry transient
+        # failures (connection errors, 5xx) at the transport level, honoring
+        # Retry-After. Rate limits (429) are left to _post, which pauses the
+        # token's broker and can switch tokens, instead of being retried here
+        # on top of its own retries while holding a request slot. Blocking on
+        # the pool makes extra threads wait for a kept-alive connection
+        # instead of opening throwaway ones. GraphQL queries are read-only,
+        # so retrying POST is safe; the final failed response is returned so
+        # execute() can report it.
+        retry = Retry(
+            total=5,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            pool_block=True,
+            max_retries=retry
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Proxy/CA settings from the environment are resolved once here
+        # instead of on every request. Timed out requests are retried by the
+        # adapter like other connection errors.
+        self._send_kwargs = self.session.merge_environment_settings(
+            self.API_URL, {}, None, None, None
+        )
+        self._send_kwargs["timeout"] = self.TIMEOUT
+
+        # Track rate limit info (updated in place from each response)
+        self._rate_limit: Dict[str, Any] = {}
+
+        # Optional persistent response cache
+        self._cache: Optional[ResponseCache] = ResponseCache(cache_dir) if use_cache else None
+
+        # Requests currently on the wire, keyed like the cache
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        # Request pacing derived from the rate limit of each response, one
+        # broker per token; each request goes out with the token whose
+        # broker has the earliest free slot
+        self.broker = broker or RateLimitBroker()
+        self.brokers = [self.broker] + [RateLimitBroker() for _ in tokens[1:]]
+
+        # Search page size learned for each query, and the size it may grow
+        # back to after a page was rejected, kept across searches
+        self._page_sizes: Dict[str, int] = {}
+        self._page_caps: Dict[str, int] = {}
+
+        # Smoothed rateLimit cost per requested result for each query; page
+        # cost is reported in whole points, so one page alone is too coarse
+        self._item_costs: Dict[str, float] = {}
 
-        # Track rate limit info
-        self._rate_limit: Optional[Dict[str, Any]] = None
+        # Last reported rateLimit cost of each query, charged to the broker
+        # for its next request (searches, README batches and user lookups
+        # cost differently, so one shared estimate would over- or
+        # under-pace the others)
+        self._query_costs: Dict[str, float] = {}
 
     @property
     def rate_limit(self) -> Optional[Dict[str, Any]]:
-        """Get the current rate limit info."""
-        return self._rate_limit
+        """Get the current rate limit info (None until known)."""
+        return self._rate_limit or None
 
-    @exponential_backoff(
-        max_retries=3,
-        base_delay=2.0,
-        exceptions=(requests.exceptions.RequestException,)
-    )
     def execute(
         self,
         query: str,
@@ -52,6 +296,10 @@ class GitHubGraphQLClient:
         """
         Execute a GraphQL query.
 
+        Identical queries issued concurrently (e.g. from execute_many) share a
+        single HTTP request: later callers wait for the in-flight one and
+        receive its result.
+
         Args:
             query: GraphQL query string
             variables: Query variables
@@ -63,25 +311,326 @@ class GitHubGraphQLClient:
             requests.exceptions.RequestException: On network errors
             ValueError: On GraphQL errors
         """
-        payload = {"query": query}
+        key = ResponseCache.make_key(query, variables)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            # Serve repeated queries from the cache (rate limit checks always go out)
+            use_cache = self._cache is not None and query is not RATE_LIMIT_QUERY
+            data = self._cache.get(key) if use_cache else None
+            if data is None:
+                data, cacheable = self._post(query, variables)
+                if use_cache and cacheable:
+                    self._cache.set(key, data)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    # Network errors and 5xx are retried by the session's urllib3 Retry; this
+    # covers rate limits (429, 403 secondary rate limits and RATE_LIMITED
+    # GraphQL errors), which go through the brokers
+    @exponential_backoff(
+        max_retries=3,
+        base_delay=2.0,
+        exceptions=(RateLimitError,),
+        jitter="full"
+    )
+    def _post(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Send a GraphQL query over HTTP.
+
+        Returns:
+            Tuple of (response data, whether the response is error-free and
+            safe to cache)
+
+        Raises:
+            RateLimitError: On HTTP 429, a 403 caused by a rate limit or a
+                RATE_LIMITED GraphQL error
+        """
+        # Content-Type is already set on the session. The query part of the
+        # body is encoded once per query string; only variables are encoded
+        # per request. Large bodies (mostly aliased batch queries) are gzipped.
+        body = b'{"query":' + _encode_query(query)
         if variables:
-            payload["variables"] = variables
+            body += b',"variables":' + orjson.dumps(variables)
+        body += b'}'
+        headers = None
+        if len(body) > self.COMPRESS_THRESHOLD:
+            body = gzip.compress(body, compresslevel=5)
+            headers = {"Content-Encoding": "gzip"}
 
-        response = self.session.post(self.API_URL, json=payload)
+        slot = min(range(len(self.brokers)), key=lambda i: self.brokers[i].next_slot)
+        broker = self.brokers[slot]
+        broker.acquire(self._query_costs.get(query))
+        request = self.session.prepare_request(
+            requests.Request("POST", self.API_URL, data=body, headers=headers, auth=self._auths[slot])
+        )
+        with self._request_slots:
+            response = self.session.send(request, **self._send_kwargs)
+
+        retry_after = self._rate_limited_wait(response)
+        if retry_after is not None:
+            raise self._rate_limit_error(
+                broker,
+                f"Rate limited (HTTP {response.status_code}), retry in {retry_after:.0f}s",
+                retry_after
+            )
         response.raise_for_status()
 
-        result = response.json()
+        result = orjson.loads(response.content)
 
         # Update rate limit info if present
-        if 'data' in result and 'rateLimit' in result['data']:
-            self._rate_limit = result['data']['rateLimit']
+        rate_limit = (result.get('data') or {}).get('rateLimit')
+        if rate_limit:
+            self._rate_limit.update(rate_limit)
+            if rate_limit.get('cost'):
+                self._query_costs[query] = float(rate_limit['cost'])
+
+        self._update_broker(broker, response.headers, rate_limit)
 
-        # Check for GraphQL errors
+        # Check for GraphQL errors. NOT_FOUND errors come back alongside
+        # partial data (e.g. one missing repo in an aliased batch) and leave
+        # the corresponding field null, so they are not fatal on their own.
         if 'errors' in result:
-            error_messages = [e.get('message', str(e)) for e in result['errors']]
-            raise ValueError(f"GraphQL errors: {'; '.join(error_messages)}")
+            fatal = [e for e in result['errors'] if e.get('type') != 'NOT_FOUND']
+            if fatal or not result.get('data'):
+                error_messages = [e.get('message', str(e)) for e in result['errors']]
+                message = f"GraphQL errors: {'; '.join(error_messages)}"
+                if any(e.get('type') in self.QUERY_LIMIT_ERRORS for e in fatal):
+                    raise QueryTooLargeError(message)
+                if any(e.get('type') == 'RATE_LIMITED' for e in fatal):
+                    # Primary limit exhausted (reported with HTTP 200): wait
+                    # for the reset the response announces
+                    raise self._rate_limit_error(broker, message, self._reset_wait(response))
+                raise ValueError(message)
+
+        return result.get('data', {}), 'errors' not in result
+
+    @staticmethod
+    def _rate_limited_wait(response: requests.Response) -> Optional[float]:
+        """
+        Get how long to wait if a response was rejected by a rate limit.
+
+        Returns:
+            Seconds to wait, or None if the response was not rate limited
+        """
+        if response.status_code not in (403, 429):
+            return None
+
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
 
-        return result.get('data', {})
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            wait = GitHubGraphQLClient._reset_wait(response)
+            if wait is not None:
+                return wait
+
+        # Secondary rate limits without a Retry-After: GitHub asks for at
+        # least a minute before retrying. The body is checked as bytes, like
+        # every other response body, so requests never guesses its charset.
+        if response.status_code == 429 or b'rate limit' in response.content.lower():
+            return 60.0
+
+        return None
+
+    def _rate_limit_error(
+        self,
+        broker: RateLimitBroker,
+        message: str,
+        retry_after: Optional[float]
+    ) -> RateLimitError:
+        """
+        Hold back the rate limited token and build the error to retry with.
+
+        With several tokens the retry is due as soon as any of them is free,
+        rather than after this token's wait.
+        """
+        if retry_after is not None:
+            broker.pause(retry_after)
+            retry_after = max(0.0, min(b.next_slot for b in self.brokers) - time.monotonic())
+        return RateLimitError(message, retry_after=retry_after)
+
+    @staticmethod
+    def _reset_wait(response: requests.Response) -> Optional[float]:
+        """Seconds until the rate limit window of a response resets, if known."""
+        reset = response.headers.get('X-RateLimit-Reset')
+        if reset:
+            try:
+                return max(0.0, float(reset) - time.time())
+            except ValueError:
+                pass
+        return None
+
+    def execute_many(
+        self,
+        payloads: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Execute several GraphQL queries concurrently.
+
+        Requests share the client's session and are bounded by a thread pool,
+        so up to ``max_workers`` round-trips overlap instead of running back
+        to back (and at most MAX_CONCURRENT_REQUESTS across the client).
+
+        Args:
+            payloads: Sequence of (query, variables) tuples
+            max_workers: Maximum concurrent requests (default: MAX_WORKERS)
+            return_exceptions: Return exceptions in place of failed results
+                instead of raising the first one
+
+        Returns:
+            List of GraphQL response data, in the same order as payloads
+        """
+        if not payloads:
+            return []
+
+        def run(payload: Tuple[str, Optional[Dict[str, Any]]]) -> Any:
+            query, variables = payload
+            try:
+                return self.execute(query, variables)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        workers = min(max_workers or self.MAX_WORKERS, len(payloads))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, payloads))
+
+    def search_repos(
+        self,
+        search: str,
+        page_size: Optional[int] = None,
+        query: str = SEARCH_REPOS_QUERY
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Iterate over the pages of a repository search.
+
+        The page size adapts to the rateLimit cost of the pages seen so far
+        (a running average per result, weighted by COST_SMOOTHING), aiming at
+        TARGET_PAGE_COST, and is halved (and capped there) when a page is
+        rejected as too large or times out. The learned size is reused by
+        later searches with the same query.
+
+        Args:
+            search: GitHub search string (e.g. "user:X stars:>=1")
+            page_size: Initial repositories per page (default: the size
+                learned for this query, else DEFAULT_PAGE_SIZE)
+            query: GraphQL search query to use (must take $query, $first
+                and $after)
+
+        Yields:
+            The ``search`` object of each page, with ``nodes``, ``pageInfo``
+            and ``repositoryCount``
+        """
+        if page_size is None:
+            page_size = self._page_sizes.get(query, self.DEFAULT_PAGE_SIZE)
+
+        cursor = None
+        while True:
+            try:
+                data = self.execute(query, {
+                    "query": search,
+                    "first": page_size,
+                    "after": cursor
+                })
+            except (QueryTooLargeError, requests.HTTPError) as e:
+                # GitHub answers oversized searches with node limit errors or
+                # 502 timeouts; retry the same page with fewer results
+                response = getattr(e, 'response', None)
+                timed_out = response is not None and response.status_code >= 500
+                if page_size <= self.MIN_PAGE_SIZE or not (timed_out or isinstance(e, QueryTooLargeError)):
+                    raise
+                page_size = max(page_size // 2, self.MIN_PAGE_SIZE)
+                self._page_sizes[query] = self._page_caps[query] = page_size
+                continue
+
+            cost = (data.get('rateLimit') or {}).get('cost')
+            if cost:
+                item_cost = cost / page_size
+                previous = self._item_costs.get(query)
+                if previous is not None:
+                    item_cost = previous + self.COST_SMOOTHING * (item_cost - previous)
+                self._item_costs[query] = item_cost
+                page_size = min(
+                    max(int(self.TARGET_PAGE_COST / item_cost), self.MIN_PAGE_SIZE),
+                    self._page_caps.get(query, self.MAX_PAGE_SIZE)
+                )
+                self._page_sizes[query] = page_size
+
+            page = data.get('search', {})
+            yield page
+
+            page_info = page.get('pageInfo', {})
+            if not page.get('nodes') or not page_info.get('hasNextPage', False):
+                return
+            cursor = page_info.get('endCursor')
+
+    def batch_repos(
+        self,
+        repos: Sequence[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch several repositories using aliased lookups.
+
+        Up to ``batch_size`` repositories are packed into a single GraphQL
+        request, so M lookups cost ceil(M / batch_size) requests, which are
+        sent concurrently.
+
+        Args:
+            repos: Sequence of (owner, name) tuples
+            batch_size: Repositories per request (default: REPO_BATCH_SIZE)
+            fields: Output columns to select (None = all, see
+                queries.REPO_FIELD_SELECTIONS)
+
+        Returns:
+            Dict mapping "owner/name" to the raw repository node (None if
+            not found), in input order
+        """
+        batch_size = batch_size or self.REPO_BATCH_SIZE
+        chunks = [repos[start:start + batch_size] for start in range(0, len(repos), batch_size)]
+
+        payloads = []
+        for chunk in chunks:
+            variables: Dict[str, Any] = {}
+            for i, (owner, name) in enumerate(chunk):
+                variables[f"owner{i}"] = owner
+                variables[f"name{i}"] = name
+            payloads.append((build_repo_batch_query(len(chunk), fields), variables))
+
+        # Batches are independent, so they are sent concurrently
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for chunk, data in zip(chunks, self.execute_many(payloads)):
+            for i, (owner, name) in enumerate(chunk):
+                results[f"{owner}/{name}"] = data.get(f"r{i}")
+
+        return results
 
     def check_rate_limit(self) -> Dict[str, Any]:
         """
@@ -93,26 +642,64 @@ class GitHubGraphQLClient:
         data = self.execute(RATE_LIMIT_QUERY)
         return data.get('rateLimit', {})
 
+    def set_rate_limit_reserve(self, reserve: int) -> None:
+        """
+        Keep part of each token's rate limit budget untouched.
+
+        This only configures the client's RateLimitBrokers and never waits.
+        Pacing happens right before each request is sent, slowing requests
+        down once the budget above ``reserve`` would run out before the reset
+        and waiting for the reset once it is used up.
+
+        Args:
+            reserve: Rate limit points to keep in reserve
+        """
+        for broker in self.brokers:
+            broker.reserve = reserve
+
     def wait_for_rate_limit(self, min_remaining: int = 100) -> None:
         """
-        Wait if rate limit is below threshold.
+        Deprecated alias of set_rate_limit_reserve (it never waits).
 
         Args:
-            min_remaining: Minimum remaining requests before waiting
+            min_remaining: Rate limit points to keep in reserve
         """
-        if not self._rate_limit:
-            self.check_rate_limit()
+        warnings.warn(
+            "wait_for_rate_limit is deprecated; use set_rate_limit_reserve",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        self.set_rate_limit_reserve(min_remaining)
 
-        remaining = self._rate_limit.get('remaining', 0)
-        reset_at = self._rate_limit.get('resetAt', '')
+    def _update_broker(
+        self,
+        broker: RateLimitBroker,
+        headers: Any,
+        rate_limit: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Pass the rate limit reported by a response to the broker of its token.
+
+        Uses the X-RateLimit-Remaining / X-RateLimit-Reset response headers,
+        falling back to the response's rateLimit block. The point cost comes
+        from rateLimit.cost when the query selects it.
+        """
+        rate_limit = rate_limit or {}
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        try:
+            if remaining is not None and reset is not None:
+                remaining = int(remaining)
+                reset_at = float(reset)
+            elif rate_limit.get('resetAt'):
+                remaining = int(rate_limit.get('remaining', 0))
+                reset_at = time.time() + calculate_wait_time(rate_limit['resetAt'])
+            else:
+                return
+        except (TypeError, ValueError):
+            return
 
-        if remaining < min_remaining and reset_at:
-            wait_time = calculate_wait_time(reset_at)
-            if wait_time > 0:
-                print(f"\n  Rate limit low ({remaining} remaining). Waiting {wait_time:.0f}s until reset...")
-                time.sleep(wait_time)
-                # Check again after waiting
-                self.check_rate_limit()
+        broker.update(remaining, reset_at, rate_limit.get('cost'))
 
     def get_rate_limit_info(self) -> str:
         """Get formatted rate limit info string."""
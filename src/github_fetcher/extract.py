@@ -0,0 +1,228 @@
+"""Flattening of GraphQL repository nodes into output rows.
+
+Kept free of other package imports so it can be compiled with mypyc (see
+setup.py); the pure Python module is used otherwise.
+
+Rows are plain dicts rather than a fixed record type: the columns present
+depend on the fields selection, and rows are what the fetcher's public
+methods return. A full row's dict takes about 0.5 KB more than a
+``__slots__`` object would (~5 MB per 10k repos), little next to the row's
+text such as README content.
+"""
+
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+
+# Shared read-only stand-in for null nested objects (owner, license, ...)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string so repeated values share one object; other values pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def extract_repo_data(
+    repo_node: Dict[str, Any],
+    fields: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Extract and flatten repository data from GraphQL response.
+
+    Args:
+        repo_node: Repository node from GraphQL response
+        fields: Output columns to keep (None = all); ``nwo`` is always kept
+
+    Returns:
+        Flattened dictionary with repository data
+    """
+    if not repo_node:
+        return {}
+    if fields is not None:
+        return {column: extract(repo_node) for column, extract in _selected_extractors(tuple(fields))}
+
+    # Extract owner info
+    owner = _owner(repo_node)
+
+    # Extract README content
+    readme_obj = repo_node.get('object')
+    readme_content = readme_obj.get('text', '') if readme_obj else ''
+
+    # Extract license info
+    license_info = repo_node.get('licenseInfo') or _EMPTY
+
+    # Extract primary language
+    primary_lang = repo_node.get('primaryLanguage') or _EMPTY
+
+    # Low-cardinality strings (languages, licenses, owners) repeat across
+    # thousands of rows; interning keeps one copy of each in memory
+    record = {
+        # Repository metadata
+        'nwo': repo_node.get('nameWithOwner', ''),
+        'name': repo_node.get('name', ''),
+        'description': repo_node.get('description', ''),
+        'url': repo_node.get('url', ''),
+        'homepage_url': repo_node.get('homepageUrl', ''),
+        'created_at': repo_node.get('createdAt', ''),
+        'updated_at': repo_node.get('updatedAt', ''),
+        'pushed_at': repo_node.get('pushedAt', ''),
+
+        # Metrics
+        'stars': repo_node.get('stargazerCount', 0),
+        'forks': repo_node.get('forkCount', 0),
+        'watchers': _count(repo_node.get('watchers')),
+        'open_issues': _count(repo_node.get('issues')),
+        'disk_usage_kb': repo_node.get('diskUsage', 0),
+
+        # Languages & topics
+        'primary_language': _intern(primary_lang.get('name', '')),
+        'languages': _languages(repo_node),
+        'topics': _topics(repo_node),
+
+        # Flags
+        'is_fork': repo_node.get('isFork', False),
+        'is_archived': repo_node.get('isArchived', False),
+        'is_private': repo_node.get('isPrivate', False),
+        'is_template': repo_node.get('isTemplate', False),
+        'has_wiki': repo_node.get('hasWikiEnabled', False),
+        'has_issues': repo_node.get('hasIssuesEnabled', False),
+
+        # License
+        'license_key': _intern(license_info.get('key', '')),
+        'license_name': _intern(license_info.get('name', '')),
+
+        # Owner information
+        'owner_login': _intern(owner.get('login', '')),
+        'owner_type': _intern(owner.get('__typename', '')),
+        'owner_location': _intern(owner.get('location', '')),
+        'owner_company': _owner_company(owner),
+        'owner_bio': _owner_bio(owner),
+        'owner_email': owner.get('email', ''),
+        'owner_followers': _count(owner.get('followers')),
+        'owner_created_at': owner.get('createdAt', ''),
+
+        # README content
+        'readme_content': readme_content,
+    }
+
+    return record
+
+
+def extract_repos(
+    repo_nodes: Iterable[Optional[Dict[str, Any]]],
+    fields: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extract a page of repository nodes, skipping null nodes.
+
+    Same output as extract_repo_data per node, with the fields selection
+    resolved once for the whole page.
+
+    Args:
+        repo_nodes: Repository nodes from a GraphQL response
+        fields: Output columns to keep (None = all); ``nwo`` is always kept
+
+    Returns:
+        List of flattened repository dictionaries
+    """
+    if fields is None:
+        return [extract_repo_data(node) for node in repo_nodes if node]
+    extractors = _selected_extractors(tuple(fields))
+    return [
+        {column: extract(node) for column, extract in extractors}
+        for node in repo_nodes if node
+    ]
+
+
+def _count(connection: Optional[Mapping[str, Any]]) -> Any:
+    """totalCount of a connection ({totalCount}), 0 when it is null or not selected."""
+    return connection.get('totalCount', 0) if connection else 0
+
+
+def _owner(repo_node: Dict[str, Any]) -> Mapping[str, Any]:
+    """Owner object of a repository node, empty when null."""
+    return repo_node.get('owner') or _EMPTY
+
+
+def _languages(repo_node: Dict[str, Any]) -> List[Any]:
+    """Names of the repository's languages."""
+    languages_nodes = repo_node.get('languages')
+    return [
+        _intern(lang.get('name')) for lang in languages_nodes.get('nodes') or () if lang
+    ] if languages_nodes else []
+
+
+def _topics(repo_node: Dict[str, Any]) -> List[Any]:
+    """Names of the repository's topics."""
+    topics_data = repo_node.get('repositoryTopics')
+    return [
+        _intern(node['topic'].get('name'))
+        for node in topics_data.get('nodes') or ()
+        if node and node.get('topic')
+    ] if topics_data else []
+
+
+def _owner_company(owner: Mapping[str, Any]) -> Any:
+    """Company of a user owner (organizations have none)."""
+    return _intern(owner.get('company', '')) if owner.get('__typename') == 'User' else ''
+
+
+def _owner_bio(owner: Mapping[str, Any]) -> Any:
+    """Bio of a user owner, or an organization's description."""
+    return owner.get('bio', '') if owner.get('__typename') == 'User' else owner.get('description', '')
+
+
+# Per-column extractors, in output order, for rows restricted to a fields
+# selection: only the selected columns are computed, so trimmed queries
+# don't pay for the full row. Full rows are built in one piece in
+# extract_repo_data (faster than calling every extractor); columns with
+# more than a lookup share their helper between the two.
+_COLUMN_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    'nwo': lambda n: n.get('nameWithOwner', ''),
+    'name': lambda n: n.get('name', ''),
+    'description': lambda n: n.get('description', ''),
+    'url': lambda n: n.get('url', ''),
+    'homepage_url': lambda n: n.get('homepageUrl', ''),
+    'created_at': lambda n: n.get('createdAt', ''),
+    'updated_at': lambda n: n.get('updatedAt', ''),
+    'pushed_at': lambda n: n.get('pushedAt', ''),
+    'stars': lambda n: n.get('stargazerCount', 0),
+    'forks': lambda n: n.get('forkCount', 0),
+    'watchers': lambda n: _count(n.get('watchers')),
+    'open_issues': lambda n: _count(n.get('issues')),
+    'disk_usage_kb': lambda n: n.get('diskUsage', 0),
+    'primary_language': lambda n: _intern((n.get('primaryLanguage') or _EMPTY).get('name', '')),
+    'languages': _languages,
+    'topics': _topics,
+    'is_fork': lambda n: n.get('isFork', False),
+    'is_archived': lambda n: n.get('isArchived', False),
+    'is_private': lambda n: n.get('isPrivate', False),
+    'is_template': lambda n: n.get('isTemplate', False),
+    'has_wiki': lambda n: n.get('hasWikiEnabled', False),
+    'has_issues': lambda n: n.get('hasIssuesEnabled', False),
+    'license_key': lambda n: _intern((n.get('licenseInfo') or _EMPTY).get('key', '')),
+    'license_name': lambda n: _intern((n.get('licenseInfo') or _EMPTY).get('name', '')),
+    'owner_login': lambda n: _intern(_owner(n).get('login', '')),
+    'owner_type': lambda n: _intern(_owner(n).get('__typename', '')),
+    'owner_location': lambda n: _intern(_owner(n).get('location', '')),
+    'owner_company': lambda n: _owner_company(_owner(n)),
+    'owner_bio': lambda n: _owner_bio(_owner(n)),
+    'owner_email': lambda n: _owner(n).get('email', ''),
+    'owner_followers': lambda n: _count(_owner(n).get('followers')),
+    'owner_created_at': lambda n: _owner(n).get('createdAt', ''),
+    'readme_content': lambda n: (n.get('object') or _EMPTY).get('text', ''),
+}
+
+
+@lru_cache(maxsize=32)
+def _selected_extractors(
+    fields: Tuple[str, ...]
+) -> Tuple[Tuple[str, Callable[[Dict[str, Any]], Any]], ...]:
+    """Extractors for a fields selection, in output order (resolved once)."""
+    return tuple(
+        (column, extract) for column, extract in _COLUMN_EXTRACTORS.items()
+        if column == 'nwo' or column in fields
+    )
@@ -1,47 +1,202 @@
 """Main fetcher class for extracting GitHub repository data."""
 
-import json
+import csv
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
-import pandas as pd
+import orjson
 from tqdm import tqdm
 
 from datetime import date, timedelta
 
 from .client import GitHubGraphQLClient
+from .extract import extract_repo_data, extract_repos
 from .queries import (
-    SEARCH_REPOS_QUERY,
-    SINGLE_REPO_QUERY,
-    USER_COUNT_QUERY,
+    REPO_FIELD_SELECTIONS,
     USER_SEARCH_QUERY,
-    USER_REPOS_QUERY,
+    build_search_repos_query,
+    build_single_repo_query,
 )
-from .utils import build_search_query, extract_repo_data
+from .utils import build_search_query
+
+# pandas and pyarrow are imported where they are used, keeping
+# `import github_fetcher` (and CLI startup) light
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+
+# Parquet type of each output column (see extract_repo_data). List columns
+# (languages, topics) are stored as JSON strings; README text uses 64-bit
+# offsets so large row groups cannot overflow a string column.
+REPO_COLUMN_TYPES = {
+    'nwo': 'string',
+    'name': 'string',
+    'description': 'string',
+    'url': 'string',
+    'homepage_url': 'string',
+    'created_at': 'string',
+    'updated_at': 'string',
+    'pushed_at': 'string',
+    'stars': 'int64',
+    'forks': 'int64',
+    'watchers': 'int64',
+    'open_issues': 'int64',
+    'disk_usage_kb': 'int64',
+    'primary_language': 'string',
+    'languages': 'string',
+    'topics': 'string',
+    'is_fork': 'bool',
+    'is_archived': 'bool',
+    'is_private': 'bool',
+    'is_template': 'bool',
+    'has_wiki': 'bool',
+    'has_issues': 'bool',
+    'license_key': 'string',
+    'license_name': 'string',
+    'owner_login': 'string',
+    'owner_type': 'string',
+    'owner_location': 'string',
+    'owner_company': 'string',
+    'owner_bio': 'string',
+    'owner_email': 'string',
+    'owner_followers': 'int64',
+    'owner_created_at': 'string',
+    'readme_content': 'large_string',
+}
+
+# Parquet compression for all written files (READMEs compress ~4:1 with zstd)
+PARQUET_OPTIONS = {'compression': 'zstd', 'compression_level': 3}
+
+
+def _arrow_schema(names: List[str]) -> "pa.Schema":
+    """Build the Arrow schema for the given output columns."""
+    import pyarrow as pa
+
+    types = {
+        'string': pa.string(),
+        'large_string': pa.large_string(),
+        'int64': pa.int64(),
+        'bool': pa.bool_(),
+    }
+    return pa.schema([(name, types[REPO_COLUMN_TYPES[name]]) for name in names])
 
 
 class GitHubFetcher:
-    """Fetcher for GitHub repository data using GraphQL API."""
+    """
+    Fetcher for GitHub repository data using GraphQL API.
+
+    The fetch methods return the fetcher's own results list. Treat it as
+    read-only (modify a copy): to_dataframe and save_to_parquet reuse a
+    table built from it, which is rebuilt only when the fetcher itself adds
+    results.
+    """
 
-    # Maximum repos per search request (reduced due to README content complexity)
-    BATCH_SIZE = 10
+    # Initial repos per search request; later pages are sized from their
+    # rateLimit cost. Searches leave out README text, which is fetched
+    # separately in batches of README_BATCH_SIZE.
+    BATCH_SIZE = 100
+    README_BATCH_SIZE = 50
 
     # Save progress every N repos
     SAVE_INTERVAL = 100
 
-    # Minimum rate limit before waiting
+    # Rate limit points kept in reserve (requests are paced to leave them)
     MIN_RATE_LIMIT = 100
 
-    def __init__(self, token: str):
+    # GitHub search limits: query length and results returned per query
+    MAX_SEARCH_QUERY_LENGTH = 256
+    MAX_SEARCH_RESULTS = 1000
+
+    # Results aimed for in each date range split off a search that exceeds
+    # MAX_SEARCH_RESULTS (some headroom below the cap), and the earliest
+    # creation date searched
+    SPLIT_TARGET = 900
+    SEARCH_START_DATE = date(2008, 1, 1)  # GitHub's founding year
+
+    def __init__(
+        self,
+        token: Union[str, Sequence[str]],
+        use_cache: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ):
         """
         Initialize the fetcher.
 
         Args:
-            token: GitHub Personal Access Token
+            token: GitHub Personal Access Token, or several to spread
+                requests over
+            use_cache: Reuse cached GraphQL responses from previous runs
+            fields: Output columns to fetch (None = all). Only these columns
+                are requested from the API; ``nwo`` is always included.
         """
-        self.client = GitHubGraphQLClient(token)
+        self.client = GitHubGraphQLClient(token, use_cache=use_cache)
+        self.client.set_rate_limit_reserve(self.MIN_RATE_LIMIT)
         self._repos: List[Dict[str, Any]] = []
 
+        # Repos already processed in this fetch; search pages can repeat a
+        # repo, so repeats are skipped before extraction
+        self._seen_nwos: Set[str] = set()
+
+        # Streaming output (parquet or CSV): rows of self._repos before
+        # _flushed have already been appended to the file at _writer_path
+        self._writer: Optional["pq.ParquetWriter"] = None
+        self._writer_path: Optional[Path] = None
+        self._flushed = 0
+
+        # Row groups are encoded and written on a background thread (pyarrow
+        # releases the GIL while compressing) so fetching continues meanwhile
+        self._write_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_write: Optional[Future] = None
+
+        # Arrow table of all results, shared by to_dataframe and
+        # save_to_parquet; cleared by _add_results and _reset_results, and
+        # rebuilt if _repos is replaced by another list
+        self._table: Optional["pa.Table"] = None
+        self._table_rows: Optional[List[Dict[str, Any]]] = None
+
+        # Queries trimmed to the requested columns. Searches never select
+        # README text (it inflates page cost); when readme_content is
+        # requested it is hydrated afterwards with batched lookups. Search
+        # results are extracted with self.fields all the same, so runs
+        # without a selection take the faster full-row path (readme_content
+        # is a placeholder until hydrated).
+        self.fields = list(fields) if fields is not None else None
+        self._include_readme = self.fields is None or 'readme_content' in self.fields
+        self._search_fields = [
+            name for name in (self.fields or REPO_FIELD_SELECTIONS) if name != 'readme_content'
+        ]
+        self._search_query = build_search_repos_query(self._search_fields)
+        self._single_repo_query = build_single_repo_query(self.fields)
+
+        # Output columns, fixed for the whole fetch so every streamed batch
+        # matches the file's schema (rows missing a column, e.g. READMEs not
+        # fetched yet, are written with nulls)
+        self._columns = [
+            name for name in REPO_COLUMN_TYPES
+            if self.fields is None or name == 'nwo' or name in self.fields
+        ]
+
     def search_repositories(
         self,
         query: str,
@@ -52,6 +207,12 @@ class GitHubFetcher:
         """
         Search for repositories using GitHub search query.
 
+        When max_repos is above MAX_SEARCH_RESULTS and the search matches
+        more repos than that, it continues over created: date ranges, each
+        within the cap. Ranges are searched oldest first, so a ``sort:``
+        qualifier in the query orders results only within each range (and
+        max_repos is reached with the earlier ranges).
+
         Args:
             query: GitHub search query string
             max_repos: Maximum number of repos to fetch
@@ -61,8 +222,10 @@ class GitHubFetcher:
         Returns:
             List of repository data dictionaries
         """
-        self._repos = []
-        cursor = None
+        if location_filter and self.fields is not None and 'owner_location' not in self.fields:
+            raise ValueError("location_filter requires the 'owner_location' field")
+
+        self._reset_results()
         total_matched = 0
         total_fetched = 0
 
@@ -71,79 +234,109 @@ class GitHubFetcher:
         if location_filter:
             print(f"Location filter: {location_filter}")
         print(f"Target: {max_repos} repositories")
-        print(f"{self.client.get_rate_limit_info()}")
+        if self.client.rate_limit:
+            print(f"{self.client.get_rate_limit_info()}")
         print()
 
         # Create progress bar
         pbar = tqdm(total=max_repos, desc="Fetching repos", unit="repo")
 
-        while total_matched < max_repos:
-            # Check rate limit before each batch
-            self.client.wait_for_rate_limit(self.MIN_RATE_LIMIT)
-
-            # Execute search query
-            variables = {
-                "query": query,
-                "first": self.BATCH_SIZE,
-                "after": cursor
-            }
-
-            try:
-                data = self.client.execute(SEARCH_REPOS_QUERY, variables)
-            except Exception as e:
-                print(f"\nError during search: {e}")
-                break
-
-            search_data = data.get('search', {})
-            nodes = search_data.get('nodes', [])
-            page_info = search_data.get('pageInfo', {})
-
-            if not nodes:
-                print("\nNo more results found.")
-                break
-
-            # Process each repository
-            for node in nodes:
-                if node:  # Skip null nodes
-                    repo_data = extract_repo_data(node)
-                    total_fetched += 1
-
-                    # Apply location filter if specified
-                    if location_filter:
-                        owner_location = (repo_data.get('owner_location') or '').lower()
-                        if location_filter.lower() not in owner_location:
-                            continue
-
-                    self._repos.append(repo_data)
-                    total_matched += 1
-                    pbar.update(1)
-
-                    if total_matched >= max_repos:
-                        break
-
-            # Save progress incrementally
-            if output_path and total_matched % self.SAVE_INTERVAL == 0:
-                self._save_progress(output_path)
-
-            # Check for more pages
-            if not page_info.get('hasNextPage', False):
-                print("\nReached end of search results.")
-                break
-
-            cursor = page_info.get('endCursor')
-
-            # Update progress bar description with rate limit
-            remaining_requests = self.client.rate_limit.get('remaining', '?') if self.client.rate_limit else '?'
-            if location_filter:
-                pbar.set_postfix({'rate_limit': remaining_requests, 'scanned': total_fetched})
-            else:
-                pbar.set_postfix({'rate_limit': remaining_requests})
+        # GitHub returns at most MAX_SEARCH_RESULTS repos per search. When
+        # more are wanted and the search matches more, it is split into
+        # created: date ranges (unless the query already sets one).
+        can_split = max_repos > self.MAX_SEARCH_RESULTS and 'created:' not in query
+        ranges: Deque[Optional[Tuple[date, date]]] = deque([None])
+        try:
+            while ranges and total_matched < max_repos:
+                created = ranges.popleft()
+                search = query
+                if created is not None:
+                    search = f"{query} created:{created[0].isoformat()}..{created[1].isoformat()}"
+
+                # Pages start at BATCH_SIZE and grow or shrink with their cost
+                pages = self.client.search_repos(search, page_size=self.BATCH_SIZE, query=self._search_query)
+                try:
+                    first_page = True
+                    for search_data in pages:
+                        nodes = search_data.get('nodes', [])
+                        page_info = search_data.get('pageInfo', {})
+
+                        if not nodes:
+                            if not ranges:
+                                print("\nNo more results found.")
+                            break
+
+                        # Process each repository
+                        page_repos = []
+                        for node in nodes:
+                            # Skip null nodes and repos already fetched
+                            if node and node.get('nameWithOwner') not in self._seen_nwos:
+                                repo_data = extract_repo_data(node, self.fields)
+                                self._seen_nwos.add(repo_data['nwo'])
+                                total_fetched += 1
+
+                                # Apply location filter if specified
+                                if location_filter:
+                                    owner_location = (repo_data.get('owner_location') or '').lower()
+                                    if location_filter.lower() not in owner_location:
+                                        continue
+
+                                page_repos.append(repo_data)
+                                total_matched += 1
+
+                                if total_matched >= max_repos:
+                                    break
+
+                        # READMEs only for the repos that passed the location
+                        # filter; rows join the results once complete
+                        self._hydrate_readmes(page_repos)
+                        self._add_results(page_repos)
+
+                        # One progress update per page rather than per repo
+                        pbar.update(len(page_repos))
+
+                        # Save progress incrementally
+                        if output_path and len(self._repos) - self._flushed >= self.SAVE_INTERVAL:
+                            self._save_progress(output_path)
+
+                        if total_matched >= max_repos:
+                            break
+
+                        # Over the cap: continue with date ranges sized from the
+                        # count (repos already found on this page are skipped
+                        # when they show up again)
+                        count = search_data.get('repositoryCount', 0)
+                        if first_page and can_split and count > self.MAX_SEARCH_RESULTS:
+                            start, end = created or (self.SEARCH_START_DATE, date.today())
+                            parts = self._split_date_range(start, end, count)
+                            if len(parts) > 1:
+                                ranges.extendleft(reversed(parts))
+                                break
+                        first_page = False
+
+                        # Check for more pages
+                        if not page_info.get('hasNextPage', False):
+                            if not ranges:
+                                print("\nReached end of search results.")
+                            break
+
+                        # Update progress bar description with rate limit
+                        remaining_requests = self.client.rate_limit.get('remaining', '?') if self.client.rate_limit else '?'
+                        if location_filter:
+                            pbar.set_postfix({'rate_limit': remaining_requests, 'scanned': total_fetched})
+                        else:
+                            pbar.set_postfix({'rate_limit': remaining_requests})
+                finally:
+                    pages.close()
+        except Exception as e:
+            print(f"\nError during search: {e}")
 
         pbar.close()
 
         # Final save
         if output_path:
             self._save_progress(output_path)
+            self.close_writer()
 
         if location_filter:
             print(f"\nFetched {len(self._repos)} repositories (scanned {total_fetched} total)")
@@ -153,6 +346,14 @@ class GitHubFetcher:
 
         return self._repos
 
+    @staticmethod
+    def _split_nwo(nwo: str) -> Tuple[str, str]:
+        """Split "owner/name" into (owner, name), raising ValueError if malformed."""
+        parts = nwo.split('/')
+        if len(parts) != 2:
+            raise ValueError(f"Invalid nwo format: {nwo}. Expected 'owner/name'")
+        return parts[0], parts[1]
+
     def fetch_repo_details(self, nwo: str) -> Optional[Dict[str, Any]]:
         """
         Fetch details for a single repository.
@@ -163,27 +364,93 @@ class GitHubFetcher:
         Returns:
             Repository data dictionary or None if not found
         """
-        parts = nwo.split('/')
-        if len(parts) != 2:
-            raise ValueError(f"Invalid nwo format: {nwo}. Expected 'owner/name'")
-
-        owner, name = parts
-
-        self.client.wait_for_rate_limit(self.MIN_RATE_LIMIT)
+        owner, name = self._split_nwo(nwo)
 
         try:
-            data = self.client.execute(SINGLE_REPO_QUERY, {
+            data = self.client.execute(self._single_repo_query, {
                 "owner": owner,
                 "name": name
             })
             repo_node = data.get('repository')
             if repo_node:
-                return extract_repo_data(repo_node)
+                return extract_repo_data(repo_node, self.fields)
         except Exception as e:
             print(f"Error fetching {nwo}: {e}")
 
         return None
 
+    def fetch_repo_details_batch(
+        self,
+        nwos: List[str],
+        batch_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch details for several repositories using batched requests.
+
+        Each request looks up ``batch_size`` repositories under GraphQL
+        aliases, so M repositories cost ceil(M / batch_size) requests.
+
+        Args:
+            nwos: Repositories in "owner/name" format
+            batch_size: Repositories per request (default:
+                GitHubGraphQLClient.REPO_BATCH_SIZE)
+
+        Returns:
+            List of repository data dictionaries for the repos that were found,
+            in input order
+        """
+        pairs = [self._split_nwo(nwo) for nwo in nwos]
+
+        try:
+            nodes = self.client.batch_repos(pairs, batch_size=batch_size, fields=self.fields)
+        except Exception as e:
+            print(f"Error fetching repositories: {e}")
+            return []
+
+        repos = []
+        for nwo, node in nodes.items():
+            if node:
+                repos.append(extract_repo_data(node, self.fields))
+            else:
+                print(f"Repository not found: {nwo}")
+        return repos
+
+    def fetch_readmes_batch(self, nwos: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Fetch README text for several repositories using batched requests.
+
+        Args:
+            nwos: Repositories in "owner/name" format
+
+        Returns:
+            Dict mapping each nwo to its README.md text ('' if the repo has
+            none, None if the repo was not found)
+        """
+        pairs = [self._split_nwo(nwo) for nwo in nwos]
+        nodes = self.client.batch_repos(
+            pairs,
+            batch_size=self.README_BATCH_SIZE,
+            fields=['readme_content']
+        )
+        return {
+            nwo: extract_repo_data(node, ['readme_content'])['readme_content'] if node else None
+            for nwo, node in nodes.items()
+        }
+
+    def _hydrate_readmes(self, repos: List[Dict[str, Any]]) -> None:
+        """Fill in readme_content for repos fetched by search, if requested."""
+        if not self._include_readme or not repos:
+            return
+
+        try:
+            readmes = self.fetch_readmes_batch([repo['nwo'] for repo in repos])
+        except Exception as e:
+            print(f"\nError fetching READMEs: {e}")
+            readmes = {}
+
+        for repo in repos:
+            repo['readme_content'] = readmes.get(repo['nwo'])
+
     def fetch_by_location(
         self,
         location: str,
@@ -245,7 +512,8 @@ class GitHubFetcher:
         self,
         location: str,
         include_orgs: bool = True,
-        max_users: Optional[int] = None
+        max_users: Optional[int] = None,
+        on_found: Optional[Callable[[List[str]], None]] = None
     ) -> List[str]:
         """
         Fetch all users/orgs from a location using date splitting to handle >1000 limit.
@@ -254,6 +522,8 @@ class GitHubFetcher:
             location: Location to search (e.g., "Peru")
             include_orgs: Whether to include organizations
             max_users: Maximum users to fetch (None = all)
+            on_found: Called with each batch of newly found logins, as soon
+                as its search page returns
 
         Returns:
             List of usernames/logins
@@ -263,7 +533,7 @@ class GitHubFetcher:
         # Fetch users
         print(f"Fetching users from {location}...")
         user_query = f'location:"{location}" type:user'
-        users = self._fetch_users_with_date_split(user_query, max_users)
+        users = self._fetch_users_with_date_split(user_query, max_users, on_found)
         all_users.extend(users)
         print(f"  Found {len(users)} users")
 
@@ -273,7 +543,8 @@ class GitHubFetcher:
             org_query = f'location:"{location}" type:org'
             orgs = self._fetch_users_with_date_split(
                 org_query,
-                max_users - len(all_users) if max_users else None
+                max_users - len(all_users) if max_users else None,
+                on_found
             )
             all_users.extend(orgs)
             print(f"  Found {len(orgs)} organizations")
@@ -284,72 +555,108 @@ class GitHubFetcher:
     def _fetch_users_with_date_split(
         self,
         base_query: str,
-        max_users: Optional[int] = None
+        max_users: Optional[int] = None,
+        on_found: Optional[Callable[[List[str]], None]] = None
     ) -> List[str]:
         """
         Fetch users using date range splitting to overcome 1000 result limit.
+
+        Ranges over the limit are split into equal parts sized from the count
+        to hold about SPLIT_TARGET users each, so most parts can be
+        fetched without being counted and split again.
         """
         users = []
-        start_date = date(2008, 1, 1)  # GitHub's founding year
-        end_date = date.today()
-
-        # Queue of date ranges to process
-        ranges = [(start_date, end_date)]
+        seen = set()  # O(1) membership checks; users keeps discovery order
+        # Queue of date ranges to process (split parts go to the front)
+        ranges = deque([(self.SEARCH_START_DATE, date.today())])
 
         with tqdm(desc="Searching users", unit="user") as pbar:
             while ranges and (max_users is None or len(users) < max_users):
-                s, e = ranges.pop(0)
+                s, e = ranges.popleft()
                 created_q = f"created:{s.isoformat()}..{e.isoformat()}"
                 query = f"{base_query} {created_q}"
 
-                self.client.wait_for_rate_limit(self.MIN_RATE_LIMIT)
-
-                # Get count for this range
-                try:
-                    data = self.client.execute(USER_COUNT_QUERY, {"query": query})
-                    count = data.get('search', {}).get('userCount', 0)
-                except Exception as ex:
-                    print(f"\n  Error counting users: {ex}")
-                    continue
-
-                if count == 0:
-                    continue
-
-                if count <= 1000:
-                    # Can fetch all users in this range
-                    remaining = max_users - len(users) if max_users else count
-                    new_users = self._paginated_user_search(query, min(count, remaining))
-                    for u in new_users:
-                        if u not in users:
-                            users.append(u)
-                            pbar.update(1)
-                            if max_users and len(users) >= max_users:
-                                break
-                else:
-                    # Split the date range in half
-                    days = (e - s).days
-                    if days <= 1:
-                        # Can't split further, just get first 1000
-                        new_users = self._paginated_user_search(query, 1000)
-                        for u in new_users:
-                            if u not in users:
-                                users.append(u)
-                                pbar.update(1)
-                    else:
-                        mid = s + timedelta(days=days // 2)
-                        ranges.insert(0, (mid + timedelta(days=1), e))
-                        ranges.insert(0, (s, mid))
+                # The first page carries the range's userCount, so ranges
+                # that fit are fetched without a separate count query. Ranges
+                # that can still be split stop after that page when over
+                # the cap.
+                days = (e - s).days
+                remaining = max_users - len(users) if max_users else self.MAX_SEARCH_RESULTS
+                new_users, count = self._paginated_user_search(
+                    query,
+                    min(remaining, self.MAX_SEARCH_RESULTS),
+                    max_total=self.MAX_SEARCH_RESULTS if days > 1 else None
+                )
+
+                found_from = len(users)
+                for u in new_users:
+                    if u not in seen:
+                        seen.add(u)
+                        users.append(u)
+                        if max_users and len(users) >= max_users:
+                            break
+                pbar.update(len(users) - found_from)
+                if on_found and len(users) > found_from:
+                    on_found(users[found_from:])
+
+                if count > self.MAX_SEARCH_RESULTS and days > 1:
+                    # Users already found on the first page are skipped when
+                    # they show up again
+                    ranges.extendleft(reversed(self._split_date_range(s, e, count)))
 
         return users
 
-    def _paginated_user_search(self, query: str, max_count: int) -> List[str]:
-        """Fetch users with pagination."""
+    def _split_date_range(self, start: date, end: date, count: int) -> List[Tuple[date, date]]:
+        """
+        Split an inclusive date range for a search matching count results.
+
+        The range is cut into as many equal parts as the count needs to get
+        each near SPLIT_TARGET results, rather than halved (which re-counts
+        every level of the split).
+
+        Args:
+            start: First day of the range
+            end: Last day of the range
+            count: Results the search matches over the whole range
+
+        Returns:
+            Consecutive (start, end) ranges covering the range, at most one
+            per day
+        """
+        days = (end - start).days
+        parts = min(-(-count // self.SPLIT_TARGET), days + 1)
+        step = (days + 1) / parts
+        cuts = [start + timedelta(days=round(i * step)) for i in range(parts)]
+        cuts.append(end + timedelta(days=1))
+        return [
+            (cuts[i], cuts[i + 1] - timedelta(days=1))
+            for i in range(parts)
+            if cuts[i] < cuts[i + 1]
+        ]
+
+    def _paginated_user_search(
+        self,
+        query: str,
+        max_count: int,
+        max_total: Optional[int] = None
+    ) -> Tuple[List[str], int]:
+        """
+        Fetch users with pagination.
+
+        Args:
+            query: GitHub user search query
+            max_count: Maximum users to return
+            max_total: Stop after the first page if the search matches more
+                users than this (the caller narrows the search instead)
+
+        Returns:
+            Tuple of (logins, total users matching the search)
+        """
         users = []
         cursor = None
+        total = 0
 
         while len(users) < max_count:
-            self.client.wait_for_rate_limit(self.MIN_RATE_LIMIT)
-
             variables = {
                 "query": query,
                 "first": min(100, max_count - len(users)),
@@ -365,6 +672,7 @@ class GitHubFetcher:
             search_data = data.get('search', {})
             nodes = search_data.get('nodes', [])
             page_info = search_data.get('pageInfo', {})
+            total = search_data.get('userCount', total)
 
             for node in nodes:
                 if node and node.get('login'):
@@ -372,15 +680,17 @@ class GitHubFetcher:
                     if len(users) >= max_count:
                         break
 
+            if max_total is not None and total > max_total:
+                break
             if not page_info.get('hasNextPage', False):
                 break
             cursor = page_info.get('endCursor')
 
-        return users
+        return users, total
 
     def fetch_repos_for_users(
         self,
-        usernames: List[str],
+        usernames: Iterable[str],
         output_path: Optional[Path] = None,
         min_stars: int = 1,
         include_forks: bool = False,
@@ -390,7 +700,9 @@ class GitHubFetcher:
         Fetch all repositories for a list of users/organizations.
 
         Args:
-            usernames: List of GitHub usernames/org names
+            usernames: GitHub usernames/org names. May be an iterator that
+                yields users as they are discovered; searches start as soon
+                as a group of users is complete.
             output_path: Optional path for incremental saves
             min_stars: Minimum stars filter (default: 1)
             include_forks: Include forked repos (default: False)
@@ -399,52 +711,132 @@ class GitHubFetcher:
         Returns:
             List of repository data dictionaries
         """
-        self._repos = []
-
-        print(f"Fetching repos for {len(usernames)} users/orgs...")
-        print(f"{self.client.get_rate_limit_info()}")
-
-        pbar = tqdm(usernames, desc="Users processed", unit="user")
-
-        for username in pbar:
-            self.client.wait_for_rate_limit(self.MIN_RATE_LIMIT)
-
-            user_repos = self._fetch_user_repos(username, min_stars, include_forks, extra_filter)
-            self._repos.extend(user_repos)
-
-            pbar.set_postfix({
-                'repos': len(self._repos),
-                'rate': self.client.rate_limit.get('remaining', '?') if self.client.rate_limit else '?'
-            })
-
-            # Save progress periodically
-            if output_path and len(self._repos) % self.SAVE_INTERVAL == 0:
-                self._save_progress(output_path)
+        self._reset_results()
+
+        # A users list (e.g. from --users-file) may repeat a user; search
+        # each one once
+        if isinstance(usernames, Sequence):
+            usernames = list(dict.fromkeys(usernames))
+        total = len(usernames) if isinstance(usernames, Sequence) else None
+        print(f"Fetching repos for {total if total is not None else 'discovered'} users/orgs...")
+        if self.client.rate_limit:
+            print(f"{self.client.get_rate_limit_info()}")
+
+        pbar = tqdm(total=total, desc="Users processed", unit="user")
+
+        # The filter suffix is the same for every search; building it once
+        # also keeps the query strings (and their cache keys) identical
+        filters = self._build_repo_filters(min_stars, include_forks, extra_filter)
+
+        # Groups are searched concurrently (the client is thread-safe and
+        # shares its rate limit pacing) as soon as they are formed; results
+        # are collected in order. Collected repos wait in unhydrated until a
+        # full README batch has gathered across groups.
+        pending: Deque[Tuple[List[str], Future]] = deque()
+        unhydrated: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=self.client.MAX_WORKERS) as executor:
+            try:
+                for group in self._group_usernames(usernames, filters):
+                    pending.append((group, executor.submit(self._fetch_user_group_repos, group, filters)))
+                    while pending and pending[0][1].done():
+                        self._collect_user_group(*pending.popleft(), unhydrated, pbar, output_path)
+                while pending:
+                    self._collect_user_group(*pending.popleft(), unhydrated, pbar, output_path)
+                self._add_hydrated(unhydrated, final=True)
+            finally:
+                # Don't start queued groups after an error or interrupt
+                for _, future in pending:
+                    future.cancel()
 
         pbar.close()
 
         # Final save
         if output_path:
             self._save_progress(output_path)
+            self.close_writer()
 
         print(f"\nFetched {len(self._repos)} total repositories")
         print(f"{self.client.get_rate_limit_info()}")
 
         return self._repos
 
-    def _fetch_user_repos(
+    def _collect_user_group(
         self,
-        username: str,
+        group: List[str],
+        future: Future,
+        unhydrated: List[Dict[str, Any]],
+        pbar: tqdm,
+        output_path: Optional[Path]
+    ) -> None:
+        """Add the repos of a searched user group to the results (see _add_hydrated)."""
+        for repo in future.result():
+            if repo['nwo'] not in self._seen_nwos:
+                self._seen_nwos.add(repo['nwo'])
+                unhydrated.append(repo)
+        self._add_hydrated(unhydrated)
+
+        pbar.update(len(group))
+        pbar.set_postfix({
+            'repos': len(self._repos),
+            'rate': self.client.rate_limit.get('remaining', '?') if self.client.rate_limit else '?'
+        })
+
+        # Save progress periodically
+        if output_path and len(self._repos) - self._flushed >= self.SAVE_INTERVAL:
+            self._save_progress(output_path)
+
+    def _add_hydrated(self, repos: List[Dict[str, Any]], final: bool = False) -> None:
+        """
+        Fetch READMEs for collected repos in full README_BATCH_SIZE batches,
+        then add them to the results.
+
+        Args:
+            repos: Collected repos without READMEs; the ones handled are
+                removed from the list
+            final: Also handle a last, partial batch
+        """
+        count = len(repos)
+        if self._include_readme and not final:
+            count -= count % self.README_BATCH_SIZE
+        if not count:
+            return
+        ready = repos[:count]
+        del repos[:count]
+        self._hydrate_readmes(ready)
+        self._add_results(ready)
+
+    def _group_usernames(self, usernames: Iterable[str], filters: str = "") -> Iterator[List[str]]:
+        """
+        Pack usernames into groups whose combined search query fits GitHub's
+        query length limit, so one search covers several users.
+
+        Groups are yielded as soon as they are full, so users can be consumed
+        while they are still being discovered.
+        """
+        filters_length = len(filters)
+        group: List[str] = []
+        length = filters_length
+
+        for username in usernames:
+            term_length = len(f"user:{username} ")
+            if group and length + term_length > self.MAX_SEARCH_QUERY_LENGTH:
+                yield group
+                group = []
+                length = filters_length
+            group.append(username)
+            length += term_length
+
+        if group:
+            yield group
+
+    @staticmethod
+    def _build_repo_filters(
         min_stars: int = 1,
         include_forks: bool = False,
         extra_filter: str = ""
-    ) -> List[Dict[str, Any]]:
-        """Fetch repos for a single user using search API with filters (Option B)."""
-        repos = []
-        cursor = None
-
-        # Build search query with user and filters
-        query_parts = [f"user:{username}"]
+    ) -> str:
+        """Build the filter suffix shared by all user repository searches."""
+        query_parts = []
 
         # Add stars filter
         if min_stars > 0:
@@ -454,101 +846,65 @@ class GitHubFetcher:
         if not include_forks:
             query_parts.append("fork:false")
 
-        # Add any extra filters
+        # Add any extra filters (whitespace normalized)
         if extra_filter:
-            query_parts.append(extra_filter)
+            query_parts.append(" ".join(extra_filter.split()))
 
-        query = " ".join(query_parts)
+        return " ".join(query_parts)
 
-        while True:
-            variables = {
-                "query": query,
-                "first": 100,
-                "after": cursor
-            }
+    @staticmethod
+    def _build_user_repos_query(usernames: List[str], filters: str = "") -> str:
+        """
+        Build a repository search query for one or more users.
 
-            try:
-                data = self.client.execute(SEARCH_REPOS_QUERY, variables)
-            except Exception as ex:
-                # User might not exist or be inaccessible
-                break
+        Args:
+            usernames: Users whose repos to search
+            filters: Prebuilt filter suffix (see _build_repo_filters)
+        """
+        if len(usernames) == 1:
+            return f"user:{usernames[0]} {filters}" if filters else f"user:{usernames[0]}"
+        users = " ".join(f"user:{username}" for username in usernames)
+        return f"{users} {filters}" if filters else users
 
-            search_data = data.get('search', {})
-            nodes = search_data.get('nodes', [])
-            page_info = search_data.get('pageInfo', {})
+    def _fetch_user_group_repos(self, usernames: List[str], filters: str = "") -> List[Dict[str, Any]]:
+        """
+        Fetch repos for several users with one combined search.
 
-            if not nodes:
-                break
+        Falls back to one search per user when the combined search fails
+        (e.g. one of the users no longer exists) or matches more repos than
+        GitHub search can return.
+        """
+        if len(usernames) == 1:
+            return self._fetch_user_repos(usernames[0], filters)
 
-            for node in nodes:
-                if not node:
-                    continue
-                # Use existing extract_repo_data which handles SEARCH_REPOS_QUERY format
-                repo = extract_repo_data(node)
-                repos.append(repo)
+        query = self._build_user_repos_query(usernames, filters)
+        repos = []
 
-            if not page_info.get('hasNextPage', False):
-                break
-            cursor = page_info.get('endCursor')
+        try:
+            for page in self.client.search_repos(query, query=self._search_query):
+                if page.get('repositoryCount', 0) > self.MAX_SEARCH_RESULTS:
+                    raise OverflowError("Search results exceed the search cap")
+                repos.extend(extract_repos(page.get('nodes', []), self.fields))
+        except Exception:
+            repos = []
+            for username in usernames:
+                repos.extend(self._fetch_user_repos(username, filters))
 
         return repos
 
-    def _extract_repo_from_user_query(
-        self,
-        node: Dict[str, Any],
-        owner_info: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Extract repo data from USER_REPOS_QUERY response."""
-        # Extract languages
-        languages_data = node.get('languages', {})
-        languages = [l.get('name') for l in languages_data.get('nodes', []) if l] if languages_data else []
-
-        # Extract topics
-        topics_data = node.get('repositoryTopics', {})
-        topics = [
-            t.get('topic', {}).get('name')
-            for t in topics_data.get('nodes', [])
-            if t and t.get('topic')
-        ] if topics_data else []
-
-        # Extract README
-        readme_obj = node.get('object')
-        readme_content = readme_obj.get('text', '') if readme_obj else ''
-
-        # Extract license
-        license_info = node.get('licenseInfo', {}) or {}
-
-        # Extract primary language
-        primary_lang = node.get('primaryLanguage', {}) or {}
+    def _fetch_user_repos(self, username: str, filters: str = "") -> List[Dict[str, Any]]:
+        """Fetch repos for a single user using search API with filters (Option B)."""
+        repos = []
+        query = self._build_user_repos_query([username], filters)
 
-        return {
-            'nwo': node.get('nameWithOwner', ''),
-            'name': node.get('name', ''),
-            'description': node.get('description', ''),
-            'url': node.get('url', ''),
-            'homepage_url': node.get('homepageUrl', ''),
-            'created_at': node.get('createdAt', ''),
-            'updated_at': node.get('updatedAt', ''),
-            'pushed_at': node.get('pushedAt', ''),
-            'stars': node.get('stargazerCount', 0),
-            'forks': node.get('forkCount', 0),
-            'watchers': node.get('watchers', {}).get('totalCount', 0) if node.get('watchers') else 0,
-            'open_issues': node.get('issues', {}).get('totalCount', 0) if node.get('issues') else 0,
-            'disk_usage_kb': node.get('diskUsage', 0),
-            'primary_language': primary_lang.get('name', ''),
-            'languages': languages,
-            'topics': topics,
-            'is_fork': node.get('isFork', False),
-            'is_archived': node.get('isArchived', False),
-            'is_private': node.get('isPrivate', False),
-            'is_template': node.get('isTemplate', False),
-            'has_wiki': node.get('hasWikiEnabled', False),
-            'has_issues': node.get('hasIssuesEnabled', False),
-            'license_key': license_info.get('key', ''),
-            'license_name': license_info.get('name', ''),
-            'readme_content': readme_content,
-            **owner_info  # Add owner info
-        }
+        try:
+            for page in self.client.search_repos(query, query=self._search_query):
+                repos.extend(extract_repos(page.get('nodes', []), self.fields))
+        except Exception:
+            # User might not exist or be inaccessible
+            pass
+
+        return repos
 
     def fetch_by_location_two_step(
         self,
@@ -566,6 +922,9 @@ class GitHubFetcher:
         1. Find all users/orgs in the location
         2. Fetch repos for each user/org
 
+        Unless users are loaded from a file, the steps run as a pipeline:
+        repos are fetched for users as soon as they are found.
+
         Args:
             location: Location to search (e.g., "Peru")
             include_orgs: Include organizations
@@ -581,6 +940,8 @@ class GitHubFetcher:
         """
         # Step 1: Get all users (or load from file)
         if users_file and users_file.exists():
+            import pandas as pd
+
             print(f"=== Step 1: Loading users from {users_file} ===")
             users_df = pd.read_csv(users_file)
             usernames = users_df['username'].tolist()
@@ -588,8 +949,23 @@ class GitHubFetcher:
                 usernames = usernames[:max_users]
             print(f"Loaded {len(usernames)} users from file")
         else:
-            print(f"=== Step 1: Finding users in {location} ===")
-            usernames = self.fetch_users_by_location(location, include_orgs, max_users)
+            print(f"=== Finding users in {location} and fetching their repos ===")
+            print(f"Filters: stars>={min_stars}, forks={'included' if include_forks else 'excluded'}")
+            if extra_filter:
+                print(f"Extra filters: {extra_filter}")
+
+            repos, usernames = self._fetch_repos_while_finding_users(
+                location,
+                include_orgs,
+                max_users,
+                lambda found: self.fetch_repos_for_users(
+                    found,
+                    output_path,
+                    min_stars,
+                    include_forks,
+                    extra_filter
+                )
+            )
 
             if not usernames:
                 print("No users found!")
@@ -597,10 +973,8 @@ class GitHubFetcher:
 
             # Save user list to separate file
             if output_path:
-                users_path = output_path.parent / f"{output_path.stem}_users.csv"
-                users_df = pd.DataFrame({'username': usernames})
-                users_df.to_csv(users_path, index=False)
-                print(f"Saved {len(usernames)} users to {users_path}")
+                self._save_users(output_path, usernames)
+            return repos
 
         # Step 2: Fetch repos for each user
         print(f"\n=== Step 2: Fetching repos for {len(usernames)} users ===")
@@ -616,42 +990,213 @@ class GitHubFetcher:
             extra_filter
         )
 
+    def _fetch_repos_while_finding_users(
+        self,
+        location: str,
+        include_orgs: bool,
+        max_users: Optional[int],
+        fetch_repos: Callable[[Iterable[str]], List[Dict[str, Any]]]
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Run user discovery on a background thread while fetch_repos consumes
+        the users it finds.
+
+        Returns:
+            Tuple of (fetched repos, all discovered usernames)
+        """
+        found: "queue.Queue[Optional[str]]" = queue.Queue()
+        outcome: Dict[str, Any] = {}
+
+        def publish(logins: List[str]) -> None:
+            for login in logins:
+                found.put(login)
+
+        def discover() -> None:
+            try:
+                outcome['users'] = self.fetch_users_by_location(
+                    location,
+                    include_orgs,
+                    max_users,
+                    on_found=publish
+                )
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                found.put(None)  # End of users
+
+        producer = threading.Thread(target=discover, name="user-discovery", daemon=True)
+        producer.start()
+        repos = fetch_repos(iter(found.get, None))
+        producer.join()
+
+        if 'error' in outcome:
+            raise outcome['error']
+        return repos, outcome['users']
+
+    @staticmethod
+    def _save_users(output_path: Path, usernames: List[str]) -> None:
+        """Save the discovered users next to the output file (for --users-file)."""
+        users_path = output_path.parent / f"{output_path.stem}_users.csv"
+        users_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(users_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(['username'])
+            writer.writerows([username] for username in usernames)
+        print(f"Saved {len(usernames)} users to {users_path}")
+
+    def _reset_results(self) -> None:
+        """Finish any streamed output and clear results before a new fetch."""
+        self.close_writer()
+        self._repos = []
+        self._seen_nwos = set()
+        self._table = None
+        self._table_rows = None
+        self._writer_path = None
+        self._flushed = 0
+
+    def _add_results(self, repos: List[Dict[str, Any]]) -> None:
+        """Append repos to the results, invalidating the cached results table."""
+        self._repos.extend(repos)
+        self._table = None
+
     def _save_progress(self, output_path: Path) -> None:
-        """Save current progress to file."""
+        """
+        Save current progress to file.
+
+        Output is streamed: only rows not yet written are appended to the
+        file (as a new row group for parquet).
+        """
         if not self._repos:
             return
 
-        df = pd.DataFrame(self._repos)
+        if self._writer_path != output_path:
+            self.open_writer(output_path)
+        self._flush_writer()
+
+    def open_writer(self, output_path: Path, schema: Optional["pa.Schema"] = None) -> None:
+        """
+        Start streaming fetched repos to a parquet (or .csv) file.
+
+        Subsequent progress saves append only new rows to this file instead of
+        rewriting it.
+
+        Args:
+            output_path: Path to output file
+            schema: Parquet schema (default: columns of the first batch, typed
+                as in REPO_COLUMN_TYPES; ignored for CSV)
+        """
+        self.close_writer()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer_path = output_path
+        self._flushed = 0
+        if schema is not None and output_path.suffix != ".csv":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(str(output_path), schema, **PARQUET_OPTIONS)
+
+    def close_writer(self) -> None:
+        """Write any remaining rows and close the streaming output file."""
+        if self._writer_path is None:
+            return
+        try:
+            self._flush_writer()
+            self._wait_for_write()
+        finally:
+            # Even after a failed write the file gets its footer, so the row
+            # groups already written stay readable. Shutting the pool down
+            # first lets a write still in flight finish.
+            if self._write_pool is not None:
+                self._write_pool.shutdown()
+                self._write_pool = None
+            self._pending_write = None
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def _flush_writer(self) -> None:
+        """Append rows not yet written to the streaming output file."""
+        rows = self._repos[self._flushed:]
+        if not rows or self._writer_path is None:
+            return
+
+        if self._writer_path.suffix == ".csv":
+            self._write_csv(self._writer_path, rows, self._columns, append=self._flushed > 0)
+            self._flushed = len(self._repos)
+            return
+
+        import pyarrow.parquet as pq
+
+        # Built against the open file's schema (e.g. one passed to open_writer)
+        names = self._writer.schema.names if self._writer is not None else self._columns
+        table = self._rows_to_table(rows, names)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(str(self._writer_path), table.schema, **PARQUET_OPTIONS)
+
+        # One write in flight at a time keeps row groups in order and
+        # surfaces a failed write on the next flush
+        self._wait_for_write()
+        if self._write_pool is None:
+            self._write_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_write = self._write_pool.submit(self._writer.write_table, table)
+        self._flushed = len(self._repos)
+
+    def _wait_for_write(self) -> None:
+        """Wait for the background row group write, re-raising its error."""
+        if self._pending_write is not None:
+            pending, self._pending_write = self._pending_write, None
+            pending.result()
+
+    @staticmethod
+    def _rows_to_table(rows: List[Dict[str, Any]], names: List[str]) -> "pa.Table":
+        """
+        Convert repo dicts to an Arrow table typed by REPO_COLUMN_TYPES.
+
+        Args:
+            rows: Repo dicts to convert
+            names: Output columns, in order; columns a row lacks are null
+        """
+        import pyarrow as pa
+
+        # Rows normally hold every column and are transposed into columns in
+        # C (itemgetter returns tuples only for two or more names). Rows
+        # missing a column take the slower per-column path.
+        columns: Optional[Dict[str, List[Any]]] = None
+        if len(names) > 1:
+            try:
+                columns = dict(zip(names, map(list, zip(*map(itemgetter(*names), rows)))))
+            except KeyError:
+                pass
+        if columns is None:
+            columns = {name: [row.get(name) for row in rows] for name in names}
 
         # Convert list columns to JSON strings for parquet compatibility
         for col in ['languages', 'topics']:
-            if col in df.columns:
-                df[col] = df[col].apply(json.dumps)
+            if col in columns:
+                columns[col] = [orjson.dumps(value).decode() for value in columns[col]]
 
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        return pa.Table.from_pydict(columns, schema=_arrow_schema(names))
 
-        # Save to parquet
-        df.to_parquet(output_path, index=False)
+    def _results_table(self) -> "pa.Table":
+        """Arrow table of all fetched repos, rebuilt only when results changed."""
+        if self._table is None or self._table_rows is not self._repos:
+            self._table = self._rows_to_table(self._repos, self._columns)
+            self._table_rows = self._repos
+        return self._table
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
         """
         Convert fetched repos to DataFrame.
 
         Returns:
             DataFrame with all repository data
         """
+        import pandas as pd
+
         if not self._repos:
             return pd.DataFrame()
 
-        df = pd.DataFrame(self._repos)
-
-        # Convert list columns to JSON strings
-        for col in ['languages', 'topics']:
-            if col in df.columns:
-                df[col] = df[col].apply(json.dumps)
-
-        return df
+        # Built column-wise through Arrow (list columns become JSON strings)
+        return self._results_table().to_pandas()
 
     def save_to_parquet(self, output_path: Path) -> None:
         """
@@ -660,14 +1205,22 @@ class GitHubFetcher:
         Args:
             output_path: Path to output parquet file
         """
-        df = self.to_dataframe()
-        if df.empty:
+        # Rows already streamed to this file only need the remainder appended
+        streamed = self._writer is not None or self._flushed == len(self._repos)
+        if self._repos and self._writer_path == output_path and streamed:
+            self.close_writer()
+            print(f"Saved {len(self._repos)} repositories to {output_path}")
+            return
+
+        if not self._repos:
             print("No data to save.")
             return
 
+        import pyarrow.parquet as pq
+
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_parquet(output_path, index=False)
-        print(f"Saved {len(df)} repositories to {output_path}")
+        pq.write_table(self._results_table(), str(output_path), **PARQUET_OPTIONS)
+        print(f"Saved {len(self._repos)} repositories to {output_path}")
 
     def save_to_csv(self, output_path: Path) -> None:
         """
@@ -676,11 +1229,43 @@ class GitHubFetcher:
         Args:
             output_path: Path to output CSV file
         """
-        df = self.to_dataframe()
-        if df.empty:
+        if not self._repos:
             print("No data to save.")
             return
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_path, index=False)
-        print(f"Saved {len(df)} repositories to {output_path}")
+        # Rows already streamed to this file only need the remainder appended
+        if self._writer_path == output_path:
+            self.close_writer()
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_csv(output_path, self._repos, self._columns)
+        print(f"Saved {len(self._repos)} repositories to {output_path}")
+
+    @staticmethod
+    def _write_csv(
+        output_path: Path,
+        rows: List[Dict[str, Any]],
+        fieldnames: List[str],
+        append: bool = False
+    ) -> None:
+        """
+        Write repos to CSV row by row, without building a DataFrame.
+
+        Args:
+            output_path: Path to output CSV file
+            rows: Repo dicts to write
+            fieldnames: Output columns, in order; columns a row lacks are empty
+            append: Append to an existing file instead of starting a new one
+                with a header row
+        """
+        with open(output_path, "a" if append else "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+            if not append:
+                writer.writeheader()
+            for repo in rows:
+                row = dict(repo)
+                # List columns are stored as JSON strings, as in parquet output
+                for col in ['languages', 'topics']:
+                    if col in row:
+                        row[col] = orjson.dumps(row[col]).decode()
+                writer.writerow(row)
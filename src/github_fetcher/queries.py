@@ -1,107 +1,189 @@
 """GraphQL query templates for GitHub API."""
 
-# Main search query that fetches all repository data in one call
-SEARCH_REPOS_QUERY = """
-query SearchRepos($query: String!, $first: Int!, $after: String) {
-  search(query: $query, type: REPOSITORY, first: $first, after: $after) {
-    pageInfo {
-      hasNextPage
-      endCursor
-    }
-    repositoryCount
-    nodes {
-      ... on Repository {
-        nameWithOwner
-        name
-        description
-        url
-        homepageUrl
-        createdAt
-        updatedAt
-        pushedAt
-        stargazerCount
-        forkCount
-        diskUsage
-        primaryLanguage {
-          name
-        }
-        languages(first: 10) {
-          nodes {
-            name
-          }
-        }
-        repositoryTopics(first: 20) {
-          nodes {
-            topic {
-              name
-            }
-          }
-        }
-        licenseInfo {
-          key
-          name
-        }
-        isFork
-        isArchived
-        isPrivate
-        isTemplate
-        hasWikiEnabled
-        hasIssuesEnabled
-        watchers {
-          totalCount
-        }
-        issues(states: OPEN) {
-          totalCount
-        }
-        owner {
-          login
-          __typename
-          ... on User {
-            location
-            company
-            bio
-            email
-            followers {
-              totalCount
-            }
-            createdAt
-          }
-          ... on Organization {
-            location
-            email
-            description
-          }
-        }
-        object(expression: "HEAD:README.md") {
-          ... on Blob {
-            text
-          }
-        }
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+# GraphQL selection for each output column (see extract.extract_repo_data).
+# Columns that share a selection (license, owner) are fetched together.
+_OWNER_SELECTION = """owner {
+    login
+    __typename
+    ... on User {
+      location
+      company
+      bio
+      email
+      followers {
+        totalCount
       }
+      createdAt
     }
-  }
-  rateLimit {
-    remaining
-    resetAt
-    limit
-    cost
-  }
+    ... on Organization {
+      location
+      email
+      description
+    }
+  }"""
+
+REPO_FIELD_SELECTIONS = {
+    'nwo': 'nameWithOwner',
+    'name': 'name',
+    'description': 'description',
+    'url': 'url',
+    'homepage_url': 'homepageUrl',
+    'created_at': 'createdAt',
+    'updated_at': 'updatedAt',
+    'pushed_at': 'pushedAt',
+    'stars': 'stargazerCount',
+    'forks': 'forkCount',
+    'watchers': 'watchers {\n    totalCount\n  }',
+    'open_issues': 'issues(states: OPEN) {\n    totalCount\n  }',
+    'disk_usage_kb': 'diskUsage',
+    'primary_language': 'primaryLanguage {\n    name\n  }',
+    'languages': 'languages(first: 10) {\n    nodes {\n      name\n    }\n  }',
+    'topics': 'repositoryTopics(first: 20) {\n    nodes {\n      topic {\n        name\n      }\n    }\n  }',
+    'is_fork': 'isFork',
+    'is_archived': 'isArchived',
+    'is_private': 'isPrivate',
+    'is_template': 'isTemplate',
+    'has_wiki': 'hasWikiEnabled',
+    'has_issues': 'hasIssuesEnabled',
+    'license_key': 'licenseInfo {\n    key\n    name\n  }',
+    'license_name': 'licenseInfo {\n    key\n    name\n  }',
+    'owner_login': _OWNER_SELECTION,
+    'owner_type': _OWNER_SELECTION,
+    'owner_location': _OWNER_SELECTION,
+    'owner_company': _OWNER_SELECTION,
+    'owner_bio': _OWNER_SELECTION,
+    'owner_email': _OWNER_SELECTION,
+    'owner_followers': _OWNER_SELECTION,
+    'owner_created_at': _OWNER_SELECTION,
+    'readme_content': 'object(expression: "HEAD:README.md") {\n    ... on Blob {\n      text\n    }\n  }',
 }
-"""
 
-# Query to count users/orgs by location
-USER_COUNT_QUERY = """
-query($query: String!) {
-  search(query: $query, type: USER, first: 1) {
-    userCount
-  }
-  rateLimit {
+# Selected by every query so the client's rate limit info stays current
+# without separate rate limit checks
+RATE_LIMIT_SELECTION = """rateLimit {
+    limit
+    cost
     remaining
     resetAt
-  }
-}
+    nodeCount
+  }"""
+
+
+def build_repo_fields_fragment(fields: Optional[Sequence[str]] = None) -> str:
+    """
+    Build the ``RepoFields`` fragment selecting only the requested columns.
+
+    Args:
+        fields: Output columns to fetch (None = all). ``nwo`` is always
+            included since it identifies the repository.
+
+    Returns:
+        GraphQL fragment definition
+
+    Raises:
+        ValueError: If a column is unknown
+    """
+    if fields is None:
+        columns = list(REPO_FIELD_SELECTIONS)
+    else:
+        unknown = [f for f in fields if f not in REPO_FIELD_SELECTIONS]
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(unknown)}. "
+                f"Available: {', '.join(REPO_FIELD_SELECTIONS)}"
+            )
+        columns = [c for c in REPO_FIELD_SELECTIONS if c == 'nwo' or c in fields]
+
+    selections = []
+    for column in columns:
+        selection = REPO_FIELD_SELECTIONS[column]
+        if selection not in selections:
+            selections.append(selection)
+
+    body = "\n  ".join(selections)
+    return f"""
+fragment RepoFields on Repository {{
+  {body}
+}}
 """
 
+
+def build_search_repos_query(fields: Optional[Sequence[str]] = None) -> str:
+    """Build the paginated repository search query for the given columns."""
+    return f"""
+query SearchRepos($query: String!, $first: Int!, $after: String) {{
+  search(query: $query, type: REPOSITORY, first: $first, after: $after) {{
+    pageInfo {{
+      hasNextPage
+      endCursor
+    }}
+    repositoryCount
+    nodes {{
+      ...RepoFields
+    }}
+  }}
+  {RATE_LIMIT_SELECTION}
+}}
+{build_repo_fields_fragment(fields)}"""
+
+
+def build_single_repo_query(fields: Optional[Sequence[str]] = None) -> str:
+    """Build the single repository lookup query for the given columns."""
+    return f"""
+query GetRepo($owner: String!, $name: String!) {{
+  repository(owner: $owner, name: $name) {{
+    ...RepoFields
+  }}
+  {RATE_LIMIT_SELECTION}
+}}
+{build_repo_fields_fragment(fields)}"""
+
+
+def build_repo_batch_query(count: int, fields: Optional[Sequence[str]] = None) -> str:
+    """
+    Build a query that fetches several repositories in one request.
+
+    Each repository is selected under an alias (``r0``, ``r1``, ...) and bound
+    to the ``$owner{i}``/``$name{i}`` variables. Only the batch shape goes into
+    the query, so the string is built once per (count, fields) and reused.
+
+    Args:
+        count: Number of repositories in the batch
+        fields: Output columns to fetch (None = all)
+
+    Returns:
+        GraphQL query string
+    """
+    return _build_repo_batch_query(count, tuple(fields) if fields is not None else None)
+
+
+@lru_cache(maxsize=64)
+def _build_repo_batch_query(count: int, fields: Optional[Tuple[str, ...]]) -> str:
+    """Build (and memoize) the batch query for a given shape."""
+    var_defs = ", ".join(
+        f"$owner{i}: String!, $name{i}: String!" for i in range(count)
+    )
+    selections = "\n".join(
+        f"  r{i}: repository(owner: $owner{i}, name: $name{i}) {{ ...RepoFields }}"
+        for i in range(count)
+    )
+    return f"""
+query GetRepos({var_defs}) {{
+{selections}
+  {RATE_LIMIT_SELECTION}
+}}
+{build_repo_fields_fragment(fields)}"""
+
+
+# Shared repository selection with every column
+REPO_FIELDS_FRAGMENT = build_repo_fields_fragment()
+
+# Main search query that fetches all repository data in one call
+SEARCH_REPOS_QUERY = build_search_repos_query()
+
 # Query to search users/orgs with pagination
 USER_SEARCH_QUERY = """
 query($query: String!, $first: Int!, $after: String) {
@@ -123,69 +205,11 @@ query($query: String!, $first: Int!, $after: String) {
     }
   }
   rateLimit {
+    limit
+    cost
     remaining
     resetAt
-  }
-}
-"""
-
-# Query to fetch repositories for a specific user/org (with full details)
-USER_REPOS_QUERY = """
-query($login: String!, $first: Int!, $after: String) {
-  repositoryOwner(login: $login) {
-    login
-    ... on User {
-      location
-      company
-      bio
-      email
-      followers { totalCount }
-      createdAt
-    }
-    ... on Organization {
-      location
-      email
-      description
-    }
-    repositories(first: $first, after: $after, ownerAffiliations: OWNER) {
-      totalCount
-      pageInfo {
-        hasNextPage
-        endCursor
-      }
-      nodes {
-        nameWithOwner
-        name
-        description
-        url
-        homepageUrl
-        createdAt
-        updatedAt
-        pushedAt
-        stargazerCount
-        forkCount
-        diskUsage
-        primaryLanguage { name }
-        languages(first: 10) { nodes { name } }
-        repositoryTopics(first: 20) { nodes { topic { name } } }
-        licenseInfo { key name }
-        isFork
-        isArchived
-        isPrivate
-        isTemplate
-        hasWikiEnabled
-        hasIssuesEnabled
-        watchers { totalCount }
-        issues(states: OPEN) { totalCount }
-        object(expression: "HEAD:README.md") {
-          ... on Blob { text }
-        }
-      }
-    }
-  }
-  rateLimit {
-    remaining
-    resetAt
+    nodeCount
   }
 }
 """
@@ -194,90 +218,14 @@ query($login: String!, $first: Int!, $after: String) {
 RATE_LIMIT_QUERY = """
 query {
   rateLimit {
-    remaining
-    resetAt
     limit
     cost
-  }
-}
-"""
-
-# Query to fetch a single repository by owner and name
-SINGLE_REPO_QUERY = """
-query GetRepo($owner: String!, $name: String!) {
-  repository(owner: $owner, name: $name) {
-    nameWithOwner
-    name
-    description
-    url
-    homepageUrl
-    createdAt
-    updatedAt
-    pushedAt
-    stargazerCount
-    forkCount
-    diskUsage
-    primaryLanguage {
-      name
-    }
-    languages(first: 10) {
-      nodes {
-        name
-      }
-    }
-    repositoryTopics(first: 20) {
-      nodes {
-        topic {
-          name
-        }
-      }
-    }
-    licenseInfo {
-      key
-      name
-    }
-    isFork
-    isArchived
-    isPrivate
-    isTemplate
-    hasWikiEnabled
-    hasIssuesEnabled
-    watchers {
-      totalCount
-    }
-    issues(states: OPEN) {
-      totalCount
-    }
-    owner {
-      login
-      __typename
-      ... on User {
-        location
-        company
-        bio
-        email
-        followers {
-          totalCount
-        }
-        createdAt
-      }
-      ... on Organization {
-        location
-        email
-        description
-      }
-    }
-    object(expression: "HEAD:README.md") {
-      ... on Blob {
-        text
-      }
-    }
-  }
-  rateLimit {
     remaining
     resetAt
-    limit
-    cost
+    nodeCount
   }
 }
 """
+
+# Query to fetch a single repository by owner and name
+SINGLE_REPO_QUERY = build_single_repo_query()
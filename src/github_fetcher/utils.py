@@ -1,16 +1,47 @@
 """Utility functions for rate limiting, retry logic, and data processing."""
 
+import asyncio
+import inspect
+import random
 import time
 from datetime import datetime
-from functools import wraps
-from typing import Any, Callable, Dict, Optional
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Literal, Optional
 
+# Row extraction lives in its own module (optionally mypyc-compiled) and is
+# re-exported here for existing imports
+from .extract import extract_repo_data, extract_repos
 
-def parse_iso_datetime(dt_string: Optional[str]) -> Optional[str]:
-    """Parse ISO datetime string and return in standard format."""
-    if not dt_string:
-        return None
-    return dt_string
+__all__ = [
+    "QueryTooLargeError",
+    "RateLimitError",
+    "build_search_query",
+    "calculate_wait_time",
+    "exponential_backoff",
+    "extract_repo_data",
+    "extract_repos",
+    "format_rate_limit_info",
+]
+
+# Seconds added to the wait for a rate limit reset, so the retry lands after it
+RESET_BUFFER = 5.0
+
+
+class RateLimitError(Exception):
+    """Raised when GitHub rejects a request because a rate limit was exceeded."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """
+        Args:
+            message: Error message
+            retry_after: Seconds GitHub asked us to wait before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class QueryTooLargeError(ValueError):
+    """Raised when GitHub rejects a query for exceeding its node or resource limits."""
 
 
 def exponential_backoff(
@@ -18,37 +49,87 @@ def exponential_backoff(
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
-    exceptions: tuple = (Exception,)
+    exceptions: tuple = (Exception,),
+    jitter: Literal["none", "full", "equal"] = "full"
 ) -> Callable:
     """
     Decorator for exponential backoff retry logic.
 
+    Works on plain functions and on coroutine functions (``async def``),
+    which sleep with ``asyncio.sleep`` between attempts.
+
+    If the caught exception carries a ``retry_after`` attribute (see
+    RateLimitError), the server-directed wait is used instead of the
+    exponential delay; it is not capped by ``max_delay``, since retrying
+    sooner would only be rejected again.
+
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay in seconds
         max_delay: Maximum delay between retries
         exponential_base: Base for exponential calculation
         exceptions: Tuple of exceptions to catch and retry on
+        jitter: How to randomize the delay so concurrent callers don't retry
+            in lockstep: "full" sleeps between 0 and the computed delay,
+            "equal" between half of it and all of it, "none" sleeps exactly
+            the computed delay. With "full" or "equal", up to ``base_delay``
+            is added to a server-directed wait.
     """
+    if jitter not in ("none", "full", "equal"):
+        raise ValueError(f"Unknown jitter mode: {jitter!r}")
+
+    def retry_delay(attempt: int, error: Exception) -> float:
+        """Seconds to wait before the retry following a failed attempt."""
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            delay = retry_after
+            if jitter != "none":
+                delay += random.uniform(0, base_delay)
+        else:
+            delay = min(base_delay * (exponential_base ** attempt), max_delay)
+            if jitter == "full":
+                delay = random.uniform(0, delay)
+            elif jitter == "equal":
+                delay = delay / 2 + random.uniform(0, delay / 2)
+        print(f"  Retry {attempt + 1}/{max_retries} after {delay:.1f}s: {str(error)[:100]}")
+        return delay
+
     def decorator(func: Callable) -> Callable:
+        # Coroutine functions get an async wrapper, so waiting for a retry
+        # suspends only that task instead of blocking the event loop. The
+        # loop's own timer heap schedules all pending retries; no thread is
+        # held per waiting call.
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        if attempt == max_retries:
+                            raise
+                        await asyncio.sleep(retry_delay(attempt, e))
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
                     if attempt == max_retries:
                         raise
-                    delay = min(base_delay * (exponential_base ** attempt), max_delay)
-                    print(f"  Retry {attempt + 1}/{max_retries} after {delay:.1f}s: {str(e)[:100]}")
-                    time.sleep(delay)
-            raise last_exception
+                    time.sleep(retry_delay(attempt, e))
         return wrapper
     return decorator
 
 
+@lru_cache(maxsize=256)
+def _parse_reset(reset_at: str) -> datetime:
+    """Parse a rateLimit resetAt timestamp (the same value repeats until the reset)."""
+    return datetime.fromisoformat(reset_at.replace('Z', '+00:00'))
+
+
 def calculate_wait_time(reset_at: str) -> float:
     """
     Calculate seconds to wait until rate limit reset.
@@ -59,10 +140,10 @@ def calculate_wait_time(reset_at: str) -> float:
     Returns:
         Seconds to wait (minimum 0)
     """
-    reset_time = datetime.fromisoformat(reset_at.replace('Z', '+00:00'))
+    reset_time = _parse_reset(reset_at)
     now = datetime.now(reset_time.tzinfo)
     wait_seconds = (reset_time - now).total_seconds()
-    return max(0, wait_seconds + 5)  # Add 5 second buffer
+    return max(0.0, wait_seconds + RESET_BUFFER)
 
 
 def format_rate_limit_info(rate_limit: Dict[str, Any]) -> str:
@@ -73,8 +154,7 @@ def format_rate_limit_info(rate_limit: Dict[str, Any]) -> str:
 
     if reset_at:
         try:
-            reset_time = datetime.fromisoformat(reset_at.replace('Z', '+00:00'))
-            reset_str = reset_time.strftime('%H:%M:%S')
+            reset_str = _parse_reset(reset_at).strftime('%H:%M:%S')
         except (ValueError, TypeError):
             reset_str = reset_at
     else:
@@ -83,101 +163,7 @@ def format_rate_limit_info(rate_limit: Dict[str, Any]) -> str:
     return f"Rate limit: {remaining}/{limit} (resets at {reset_str})"
 
 
-def extract_repo_data(repo_node: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Extract and flatten repository data from GraphQL response.
-
-    Args:
-        repo_node: Repository node from GraphQL response
-
-    Returns:
-        Flattened dictionary with all repository data
-    """
-    if not repo_node:
-        return {}
-
-    # Extract owner info
-    owner = repo_node.get('owner', {}) or {}
-    owner_typename = owner.get('__typename', '')
-
-    # Extract languages list
-    languages_nodes = repo_node.get('languages', {})
-    if languages_nodes:
-        languages = [lang.get('name') for lang in languages_nodes.get('nodes', []) if lang]
-    else:
-        languages = []
-
-    # Extract topics list
-    topics_data = repo_node.get('repositoryTopics', {})
-    if topics_data:
-        topics = [
-            node.get('topic', {}).get('name')
-            for node in topics_data.get('nodes', [])
-            if node and node.get('topic')
-        ]
-    else:
-        topics = []
-
-    # Extract README content
-    readme_obj = repo_node.get('object')
-    readme_content = readme_obj.get('text', '') if readme_obj else ''
-
-    # Extract license info
-    license_info = repo_node.get('licenseInfo', {}) or {}
-
-    # Extract primary language
-    primary_lang = repo_node.get('primaryLanguage', {}) or {}
-
-    return {
-        # Repository metadata
-        'nwo': repo_node.get('nameWithOwner', ''),
-        'name': repo_node.get('name', ''),
-        'description': repo_node.get('description', ''),
-        'url': repo_node.get('url', ''),
-        'homepage_url': repo_node.get('homepageUrl', ''),
-        'created_at': repo_node.get('createdAt', ''),
-        'updated_at': repo_node.get('updatedAt', ''),
-        'pushed_at': repo_node.get('pushedAt', ''),
-
-        # Metrics
-        'stars': repo_node.get('stargazerCount', 0),
-        'forks': repo_node.get('forkCount', 0),
-        'watchers': repo_node.get('watchers', {}).get('totalCount', 0) if repo_node.get('watchers') else 0,
-        'open_issues': repo_node.get('issues', {}).get('totalCount', 0) if repo_node.get('issues') else 0,
-        'disk_usage_kb': repo_node.get('diskUsage', 0),
-
-        # Languages & topics
-        'primary_language': primary_lang.get('name', ''),
-        'languages': languages,
-        'topics': topics,
-
-        # Flags
-        'is_fork': repo_node.get('isFork', False),
-        'is_archived': repo_node.get('isArchived', False),
-        'is_private': repo_node.get('isPrivate', False),
-        'is_template': repo_node.get('isTemplate', False),
-        'has_wiki': repo_node.get('hasWikiEnabled', False),
-        'has_issues': repo_node.get('hasIssuesEnabled', False),
-
-        # License
-        'license_key': license_info.get('key', ''),
-        'license_name': license_info.get('name', ''),
-
-        # Owner information
-        'owner_login': owner.get('login', ''),
-        'owner_type': owner_typename,
-        'owner_location': owner.get('location', ''),
-        'owner_company': owner.get('company', '') if owner_typename == 'User' else '',
-        'owner_bio': owner.get('bio', '') if owner_typename == 'User' else owner.get('description', ''),
-        'owner_email': owner.get('email', ''),
-        'owner_followers': owner.get('followers', {}).get('totalCount', 0) if owner.get('followers') else 0,
-        'owner_created_at': owner.get('createdAt', ''),
-
-        # README content
-        'readme_content': readme_content,
-    }
-
-
+@lru_cache(maxsize=64)
 def build_search_query(
     language: Optional[str] = None,
     min_stars: int = 5,